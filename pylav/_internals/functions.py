@@ -13,6 +13,8 @@ from pylav.type_hints.generics import ANY_GENERIC_TYPE, PARAM_SPEC_TYPE
 
 T = TypeVar("T")
 
+_RESOLVED_PATHS: dict[tuple[object, object, str | None], str] = {}
+
 
 def _get_path(path: T | pathlib.Path) -> str | T | None:
     return get_true_path(path, fallback=path)
@@ -62,12 +64,22 @@ def add_property(inst: object, name: str, method: Callable) -> None:
 
 
 def get_true_path(executable: str, fallback: ANY_GENERIC_TYPE = None) -> str | ANY_GENERIC_TYPE | None:
-    """Returns the true path of the executable."""
+    """Returns the true path of the executable.
+
+    Successful lookups are memoized for the current ``JAVA_HOME`` and ``PATH``,
+    misses are not, so an executable installed while running is still picked up.
+    """
 
     path = os.environ.get("JAVA_HOME", executable)
+    key = (executable, path, os.environ.get("PATH"))
+    if (resolved := _RESOLVED_PATHS.get(key)) is not None:
+        return resolved
     with add_env_path(path if os.path.isdir(path) else os.path.split(path)[0]) as path_string:
-        executable = shutil.which(executable, path=path_string)
-    return executable or fallback
+        resolved = shutil.which(executable, path=path_string)
+    if resolved is None:
+        return fallback
+    _RESOLVED_PATHS[key] = resolved
+    return resolved
 
 
 @contextlib.contextmanager
@@ -91,13 +103,5 @@ def add_env_path(path: str | os.PathLike) -> Iterator[str]:
 def fix(string: str, data, *, e: bool = False) -> str | bytes:
     index_list, rem = data
     new_string = string[rem : -1 * rem]
-    res = ""
-    for idx in range(0, len(new_string)):
-        # checking for index list for uppercase
-        if idx in index_list:
-            res += new_string[idx].upper()
-        else:
-            res += new_string[idx]
-    res += "=="
-    final = res
+    final = "".join(char.upper() if idx in index_list else char for idx, char in enumerate(new_string)) + "=="
     return final.encode() if e else final
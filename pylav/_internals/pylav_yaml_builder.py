@@ -45,6 +45,7 @@ def build_from_envvars() -> None:
         TASK_TIMER_UPDATE_BUNDLED_PLAYLISTS_DAYS,
         TASK_TIMER_UPDATE_EXTERNAL_PLAYLISTS_DAYS,
     )
+    from pylav.constants.config.utils import _SafeDumper
 
     if not os.access(ENV_FILE, os.W_OK):
         return LOGGER.error("Cannot write to %s", ENV_FILE)
@@ -81,4 +82,4 @@ def build_from_envvars() -> None:
     }
     with ENV_FILE.open(mode="w") as file:
         LOGGER.debug("Creating %s with the following content: %r", ENV_FILE, data)
-        yaml.safe_dump(data, file, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        yaml.dump(data, file, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
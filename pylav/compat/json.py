@@ -284,8 +284,11 @@ def dumps(
 
     """
     if _orjson:
-        with contextlib.suppress(_orjson.JSONEncodeError):
+        # try/except rather than contextlib.suppress, this runs for every websocket and REST payload
+        try:
             return _orjson.dumps(obj, default=orjson_default, option=orjson_option).decode()
+        except _orjson.JSONEncodeError:
+            pass
     if _ujson:
         return _ujson.dumps(
             obj,
@@ -361,11 +364,16 @@ def loads(
 
     """
     if _orjson:
-        with contextlib.suppress(_orjson.JSONDecodeError):
+        # try/except rather than contextlib.suppress, this runs for every websocket and REST payload
+        try:
             return _orjson.loads(obj)
+        except _orjson.JSONDecodeError:
+            pass
     if _ujson:
-        with contextlib.suppress(_ujson.JSONDecodeError):
+        try:
             return _ujson.loads(obj, precise_float=ujson_precise_float)
+        except _ujson.JSONDecodeError:
+            pass
     return json.loads(
         obj,
         cls=cls,
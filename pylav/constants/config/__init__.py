@@ -12,20 +12,20 @@ if os.environ.get("READTHEDOCS"):
 
 # noinspection PyProtectedMember
 from pylav._internals.pylav_yaml_builder import build_from_envvars
-from pylav.constants.config.utils import in_container
+from pylav.constants.config.utils import _ENV, in_container
 from pylav.logging import getLogger
 
 LOGGER = getLogger("PyLav.Environment")
 
 INSTANCE_NAME = None
 
-if (data_folder := os.getenv("PYLAV__DATA_FOLDER")) is not None:
+if (data_folder := _ENV.get("PYLAV__DATA_FOLDER")) is not None:
     DATA_FOLDER = pathlib.Path(data_folder)
     del data_folder
 else:
     DATA_FOLDER = pathlib.Path.home()
 
-ENV_FILE: pathlib.Path = pathlib.Path(os.getenv("PYLAV__YAML_CONFIG", DATA_FOLDER / "pylav.yaml"))
+ENV_FILE: pathlib.Path = pathlib.Path(_ENV.get("PYLAV__YAML_CONFIG", DATA_FOLDER / "pylav.yaml"))
 
 
 if not ENV_FILE.exists():
@@ -133,7 +133,7 @@ else:
 IN_CONTAINER = in_container() or any(
     i
     for i in {"PYLAV__IN_CONTAINER", "PCX_DISCORDBOT_TAG", "PCX_DISCORDBOT_BUILD", "PCX_DISCORDBOT_COMMIT"}
-    if i in os.environ
+    if i in _ENV
 )
 
 BROTLI_ENABLED = False
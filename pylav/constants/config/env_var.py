@@ -1,60 +1,54 @@
 from __future__ import annotations
 
-import base64
-import os
-
 # noinspection PyProtectedMember
-from pylav._internals.functions import _get_path, fix
+from pylav._internals.functions import _get_path
+from pylav.constants.config.utils import _ENV, _decode_deezer_key, _env_bool, _env_int
 from pylav.constants.node_features import SUPPORTED_SEARCHES
-from pylav.constants.specials import _MAPPING, ANIME
+from pylav.constants.specials import ANIME
 from pylav.logging import getLogger
 
 LOGGER = getLogger("PyLav.Environment")
 
-LOCAL_DEBUGGING = os.getenv("PYLAV__DEBUGGING", False)
+_g = _ENV.get
+
+LOCAL_DEBUGGING = _g("PYLAV__DEBUGGING", False)
 
-POSTGRES_HOST = os.getenv("PYLAV__POSTGRES_HOST", os.getenv("PGHOST"))
+POSTGRES_HOST = _g("PYLAV__POSTGRES_HOST", _g("PGHOST"))
 # noinspection SpellCheckingInspection
-POSTGRES_PORT = os.getenv("PYLAV__POSTGRES_PORT", os.getenv("PGPORT"))
+POSTGRES_PORT = _g("PYLAV__POSTGRES_PORT", _g("PGPORT"))
 # noinspection SpellCheckingInspection
-POSTGRES_PASSWORD = os.getenv("PYLAV__POSTGRES_PASSWORD", os.getenv("PGPASSWORD"))
+POSTGRES_PASSWORD = _g("PYLAV__POSTGRES_PASSWORD", _g("PGPASSWORD"))
 # noinspection SpellCheckingInspection
-POSTGRES_USER = os.getenv("PYLAV__POSTGRES_USER", os.getenv("PGUSER"))
+POSTGRES_USER = _g("PYLAV__POSTGRES_USER", _g("PGUSER"))
 # noinspection SpellCheckingInspection
-POSTGRES_DATABASE = os.getenv("PYLAV__POSTGRES_DB", os.getenv("PGDATABASE"))
-POSTGRES_SOCKET = os.getenv("PYLAV__POSTGRES_SOCKET")
-POSTGRES_CONNECTIONS = (
-    max(int(envar_value), 4) if (envar_value := os.getenv("PYLAV__POSTGRES_CONNECTIONS", "100")) is not None else None
-)
+POSTGRES_DATABASE = _g("PYLAV__POSTGRES_DB", _g("PGDATABASE"))
+POSTGRES_SOCKET = _g("PYLAV__POSTGRES_SOCKET")
+POSTGRES_CONNECTIONS = _env_int("PYLAV__POSTGRES_CONNECTIONS", 100, minimum=4)
 
 FALLBACK_POSTGREST_HOST = POSTGRES_HOST
 if POSTGRES_SOCKET is not None:
     POSTGRES_PORT = None
     POSTGRES_HOST = POSTGRES_SOCKET
-JAVA_EXECUTABLE = _get_path(os.getenv("PYLAV__JAVA_EXECUTABLE") or "java")
+JAVA_EXECUTABLE = _get_path(_g("PYLAV__JAVA_EXECUTABLE") or "java")
 
-REDIS_FULL_ADDRESS_RESPONSE_CACHE = os.getenv("PYLAV__REDIS_FULL_ADDRESS_RESPONSE_CACHE")
+REDIS_FULL_ADDRESS_RESPONSE_CACHE = _g("PYLAV__REDIS_FULL_ADDRESS_RESPONSE_CACHE")
 
-EXTERNAL_UNMANAGED_HOST = os.getenv("PYLAV__EXTERNAL_UNMANAGED_HOST")
-EXTERNAL_UNMANAGED_PORT = int(os.getenv("PYLAV__EXTERNAL_UNMANAGED_PORT", "80"))
-EXTERNAL_UNMANAGED_PASSWORD = os.getenv("PYLAV__EXTERNAL_UNMANAGED_PASSWORD")
-EXTERNAL_UNMANAGED_SSL = bool(int(os.getenv("PYLAV__EXTERNAL_UNMANAGED_SSL", 0)))
-EXTERNAL_UNMANAGED_NAME = os.getenv("PYLAV__EXTERNAL_UNMANAGED_NAME") or "ENVAR Node (Unmanaged)"
+EXTERNAL_UNMANAGED_HOST = _g("PYLAV__EXTERNAL_UNMANAGED_HOST")
+EXTERNAL_UNMANAGED_PORT = _env_int("PYLAV__EXTERNAL_UNMANAGED_PORT", 80)
+EXTERNAL_UNMANAGED_PASSWORD = _g("PYLAV__EXTERNAL_UNMANAGED_PASSWORD")
+EXTERNAL_UNMANAGED_SSL = _env_bool("PYLAV__EXTERNAL_UNMANAGED_SSL", False)
+EXTERNAL_UNMANAGED_NAME = _g("PYLAV__EXTERNAL_UNMANAGED_NAME") or "ENVAR Node (Unmanaged)"
 
-READ_CACHING_ENABLED = bool(int(os.getenv("PYLAV__READ_CACHING_ENABLED", "0")))
+READ_CACHING_ENABLED = _env_bool("PYLAV__READ_CACHING_ENABLED", False)
 
-TASK_TIMER_UPDATE_BUNDLED_PLAYLISTS_DAYS = max(
-    int(os.getenv("PYLAV__TASK_TIMER_UPDATE_BUNDLED_PLAYLISTS_DAYS", "1")), 1
-)
-TASK_TIMER_UPDATE_BUNDLED_EXTERNAL_PLAYLISTS_DAYS = max(
-    int(os.getenv("PYLAV__TASK_TIMER_UPDATE_BUNDLED_EXTERNAL_PLAYLISTS_DAYS", "7")), 7
-)
-TASK_TIMER_UPDATE_EXTERNAL_PLAYLISTS_DAYS = max(
-    int(os.getenv("PYLAV__TASK_TIMER_UPDATE_EXTERNAL_PLAYLISTS_DAYS", "7")), 7
+TASK_TIMER_UPDATE_BUNDLED_PLAYLISTS_DAYS = _env_int("PYLAV__TASK_TIMER_UPDATE_BUNDLED_PLAYLISTS_DAYS", 1, minimum=1)
+TASK_TIMER_UPDATE_BUNDLED_EXTERNAL_PLAYLISTS_DAYS = _env_int(
+    "PYLAV__TASK_TIMER_UPDATE_BUNDLED_EXTERNAL_PLAYLISTS_DAYS", 7, minimum=7
 )
+TASK_TIMER_UPDATE_EXTERNAL_PLAYLISTS_DAYS = _env_int("PYLAV__TASK_TIMER_UPDATE_EXTERNAL_PLAYLISTS_DAYS", 7, minimum=7)
 
 # noinspection SpellCheckingInspection
-DEFAULT_SEARCH_SOURCE = os.getenv("PYLAV__DEFAULT_SEARCH_SOURCE", "dzsearch")
+DEFAULT_SEARCH_SOURCE = _g("PYLAV__DEFAULT_SEARCH_SOURCE", "dzsearch")
 if DEFAULT_SEARCH_SOURCE not in SUPPORTED_SEARCHES:
     # noinspection SpellCheckingInspection
     LOGGER.warning("Invalid search source %s, defaulting to dzsearch", DEFAULT_SEARCH_SOURCE)
@@ -62,29 +56,16 @@ if DEFAULT_SEARCH_SOURCE not in SUPPORTED_SEARCHES:
     # noinspection SpellCheckingInspection
     DEFAULT_SEARCH_SOURCE = "dzsearch"
 
-MANAGED_NODE_SPOTIFY_CLIENT_ID = os.getenv("PYLAV__MANAGED_NODE_SPOTIFY_CLIENT_ID", "")
-MANAGED_NODE_SPOTIFY_CLIENT_SECRET = os.getenv("PYLAV__MANAGED_NODE_SPOTIFY_CLIENT_SECRET", "")
-MANAGED_NODE_SPOTIFY_COUNTRY_CODE = os.getenv("PYLAV__MANAGED_NODE_SPOTIFY_COUNTRY_CODE", "US")
-MANAGED_NODE_APPLE_MUSIC_API_KEY = os.getenv("PYLAV__MANAGED_NODE_APPLE_MUSIC_API_KEY", "")
-MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE = os.getenv("PYLAV__MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE", "US")
-MANAGED_NODE_YANDEX_MUSIC_ACCESS_TOKEN = os.getenv("PYLAV__MANAGED_NODE_YANDEX_MUSIC_ACCESS_TOKEN", "")
-MANAGED_NODE_DEEZER_KEY = os.getenv("PYLAV__MANAGED_NODE_DEEZER_KEY") or ANIME
+MANAGED_NODE_SPOTIFY_CLIENT_ID = _g("PYLAV__MANAGED_NODE_SPOTIFY_CLIENT_ID", "")
+MANAGED_NODE_SPOTIFY_CLIENT_SECRET = _g("PYLAV__MANAGED_NODE_SPOTIFY_CLIENT_SECRET", "")
+MANAGED_NODE_SPOTIFY_COUNTRY_CODE = _g("PYLAV__MANAGED_NODE_SPOTIFY_COUNTRY_CODE", "US")
+MANAGED_NODE_APPLE_MUSIC_API_KEY = _g("PYLAV__MANAGED_NODE_APPLE_MUSIC_API_KEY", "")
+MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE = _g("PYLAV__MANAGED_NODE_APPLE_MUSIC_COUNTRY_CODE", "US")
+MANAGED_NODE_YANDEX_MUSIC_ACCESS_TOKEN = _g("PYLAV__MANAGED_NODE_YANDEX_MUSIC_ACCESS_TOKEN", "")
+MANAGED_NODE_DEEZER_KEY = _g("PYLAV__MANAGED_NODE_DEEZER_KEY") or ANIME
 if MANAGED_NODE_DEEZER_KEY and MANAGED_NODE_DEEZER_KEY.startswith("id"):
-    _temp = [MANAGED_NODE_DEEZER_KEY[i : i + 16] for i in range(0, len(MANAGED_NODE_DEEZER_KEY), 16)]
-    MANAGED_NODE_DEEZER_KEY = "".join(
-        [
-            base64.b64decode(r).decode()
-            for r in [
-                fix(_temp[2], _MAPPING[2]),
-                fix(_temp[1], _MAPPING[1]),
-                fix(_temp[3], _MAPPING[3]),
-                fix(_temp[0], _MAPPING[0]),
-            ]
-        ]
-    )
-LOCAL_TRACKS_FOLDER = os.getenv("PYLAV__LOCAL_TRACKS_FOLDER")
-DATA_FOLDER = os.getenv("PYLAV__DATA_FOLDER")
-ENABLE_NODE_RESUMING = bool(int(os.getenv("PYLAV__ENABLE_NODE_RESUMING", "1")))
-DEFAULT_PLAYER_VOLUME = (
-    max(int(envar_value), 1) if (envar_value := os.getenv("PYLAV__DEFAULT_PLAYER_VOLUME")) is not None else 25
-)
+    MANAGED_NODE_DEEZER_KEY = _decode_deezer_key(MANAGED_NODE_DEEZER_KEY)
+LOCAL_TRACKS_FOLDER = _g("PYLAV__LOCAL_TRACKS_FOLDER")
+DATA_FOLDER = _g("PYLAV__DATA_FOLDER")
+ENABLE_NODE_RESUMING = _env_bool("PYLAV__ENABLE_NODE_RESUMING", True)
+DEFAULT_PLAYER_VOLUME = _env_int("PYLAV__DEFAULT_PLAYER_VOLUME", 25, minimum=1)
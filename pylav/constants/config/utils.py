@@ -1,7 +1,44 @@
 from __future__ import annotations
 
+import base64
 import os
 import pathlib
+from typing import TypeVar
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+T = TypeVar("T")
+
+# noinspection PyProtectedMember
+from pylav._internals.functions import fix
+from pylav.constants.specials import _MAPPING
+
+_ENV: dict[str, str] = dict(os.environ)
+
+
+def refresh_env() -> None:
+    """Refresh the cached snapshot of the process environment.
+
+    The config modules read environment variables from a snapshot taken at import time,
+    call this if the environment has been changed since and needs to be re-read.
+    """
+    _ENV.clear()
+    _ENV.update(os.environ)
+
+
+def _env_int(key: str, default: T, minimum: int | None = None) -> int | T:
+    if (value := _ENV.get(key)) is None:
+        return default
+    return int(value) if minimum is None else max(int(value), minimum)
+
+
+def _env_bool(key: str, default: T) -> bool | T:
+    return default if (value := _ENV.get(key)) is None else bool(int(value))
 
 
 def _remove_keys(*keys, data: dict) -> dict:
@@ -10,6 +47,11 @@ def _remove_keys(*keys, data: dict) -> dict:
     return data
 
 
+def _decode_deezer_key(key: str) -> str:
+    chunks = [key[i : i + 16] for i in range(0, len(key), 16)]
+    return "".join(base64.b64decode(fix(chunks[i], _MAPPING[i])).decode() for i in (2, 1, 3, 0))
+
+
 def in_container() -> bool:
     """Check if the current process is running in a container.
 
@@ -45,40 +45,47 @@ LAVALINK_VERSION_LINE = re.compile(rb"Version:\s+(?P<version>.+?)\n")
 LAVALINK__READY_LINE = re.compile(rb"Lavalink is ready to accept connections")
 LAVALINK_FAILED_TO_START = re.compile(rb"Web server failed to start\. (.*)")
 
+# Patterns for rarely used sources are only compiled the first time they are accessed, see `__getattr__` below
+_LAZY_PATTERNS: dict[str, tuple[str, int]] = {}
+
+# The source URL patterns are matched against the lowercased query by `Query`, so they are compiled without re.IGNORECASE
 # noinspection SpellCheckingInspection
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/clypit/ClypitAudioSourceManager.java
-SOURCE_INPUT_MATCH_CLYPIT = re.compile(r"^(http://|https://(www\.)?)?clyp\.it/(.*)", re.IGNORECASE)
+SOURCE_INPUT_MATCH_CLYPIT = re.compile(r"^(http://|https://(www\.)?)?clyp\.it/(.*)")
 # noinspection SpellCheckingInspection
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/getyarn/GetyarnAudioSourceManager.java
-SOURCE_INPUT_MATCH_GETYARN = re.compile(r"^(?:http://|https://(?:www\.)?)?getyarn\.io/yarn-clip/(.*)", re.IGNORECASE)
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_GETYARN"] = (r"^(?:http://|https://(?:www\.)?)?getyarn\.io/yarn-clip/(.*)", 0)
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/mixcloud/MixcloudAudioSourceManager.java
-SOURCE_INPUT_MATCH_MIXCLOUD = re.compile(
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_MIXCLOUD"] = (
     r"^https?://(?:(?:www|beta|m)\.)?mixcloud\.com/([^/]+)/(?!stream|uploads|favorites|listens|playlists)([^/]+)/?",
-    re.IGNORECASE,
+    0,
 )
 # noinspection SpellCheckingInspection
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/ocremix/OCRemixAudioSourceManager.java
-SOURCE_INPUT_MATCH_OCRREMIX = re.compile(
-    r"^(?:https?://(?:www\.)?ocremix\.org/remix/)?(?P<ocrmix_id>OCR[\d]+)(?:.*)?", re.IGNORECASE
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_OCRREMIX"] = (
+    r"^(?:https?://(?:www\.)?ocremix\.org/remix/)?(?P<ocrmix_id>OCR[\d]+)(?:.*)?",
+    re.IGNORECASE,
 )
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/pornhub/PornHubAudioSourceManager.java
-SOURCE_INPUT_MATCH_PORNHUB = re.compile(
-    r"^https?://([a-z]+\.)?pornhub\.(com|net|org)/view_video\.php\?viewkey=([a-zA-Z0-9]+)(?:.*)$", re.IGNORECASE
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_PORNHUB"] = (
+    r"^https?://([a-z]+\.)?pornhub\.(com|net|org)/view_video\.php\?viewkey=([a-zA-Z0-9]+)(?:.*)$",
+    0,
 )
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/reddit/RedditAudioSourceManager.java
 SOURCE_INPUT_MATCH_REDDIT = re.compile(
     r"^https://(?:www|old)\.reddit\.com/r/(?:[^\\/]+)\\/(?:[^/]+)/([^/]+)(?:/?(?:[^/]+)?/?)?|"
-    r"^https://v\.redd\.it/([^/]+)(?:.*)?",
-    re.IGNORECASE,
+    r"^https://v\.redd\.it/([^/]+)(?:.*)?"
 )
 # noinspection SpellCheckingInspection
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/soundgasm/SoundGasmAudioSourceManager.java
-SOURCE_INPUT_MATCH_SOUNDGASM = re.compile(
-    r"^https?://soundgasm\.net/u/(?P<soundgasm_path>(?P<soundgasm_author>[^/]+)/[^/]+)", re.IGNORECASE
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_SOUNDGASM"] = (
+    r"^https?://soundgasm\.net/u/(?P<soundgasm_path>(?P<soundgasm_author>[^/]+)/[^/]+)",
+    0,
 )
 # https://github.com/DuncteBot/skybot-lavalink-plugin/blob/master/source-managers/src/main/java/com/dunctebot/sourcemanagers/tiktok/TikTokAudioSourceManager.java
-SOURCE_INPUT_MATCH_TIKTOK = re.compile(
-    r"^https://(?:www\.|m\.)?tiktok\.com/@(?P<tiktok_user>[^/]+)/video/(?P<tiktok_video>[0-9]+)(?:.*)$", re.IGNORECASE
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_TIKTOK"] = (
+    r"^https://(?:www\.|m\.)?tiktok\.com/@(?P<tiktok_user>[^/]+)/video/(?P<tiktok_video>[0-9]+)(?:.*)$",
+    0,
 )
 
 # https://github.com/topi314/LavaSrc/blob/master/main/src/main/java/com/github/topi314/lavasrc/spotify/SpotifySourceManager.java#L39
@@ -87,36 +94,38 @@ SOURCE_INPUT_MATCH_SPOTIFY = re.compile(
     r"(?P<spotify_region>[a-zA-Z-]+)/)?(user/"
     r"(?P<spotify_user>[a-zA-Z\d\-_]+)/)?"
     r"(?P<spotify_type>track|album|playlist|artist)/"
-    r"(?P<spotify_identifier>[a-zA-Z\d\-_]+)",
-    re.IGNORECASE,
+    r"(?P<spotify_identifier>[a-zA-Z\d\-_]+)"
 )
 # https://github.com/topi314/LavaSrc/blob/master/main/src/main/java/com/github/topi314/lavasrc/applemusic/AppleMusicSourceManager.java#L33
 SOURCE_INPUT_MATCH_APPLE_MUSIC = re.compile(
-    r"^(https?://)?(www\.)?music\.apple\.com/(?P<amcountrycode>[a-zA-Z]{2}/)?(?P<type>album|playlist|artist|song)(/[a-zA-Z\d\-]+)?/(?P<identifier>[a-zA-Z\d\-.]+)(\?i=(?P<identifier2>\d+))?",
-    re.IGNORECASE,
+    r"^(https?://)?(www\.)?music\.apple\.com/(?P<amcountrycode>[a-zA-Z]{2}/)?(?P<type>album|playlist|artist|song)(/[a-zA-Z\d\-]+)?/(?P<identifier>[a-zA-Z\d\-.]+)(\?i=(?P<identifier2>\d+))?"
 )
 # https://github.com/lavalink-devs/lavaplayer/tree/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/bandcamp/BandcampAudioSourceManager.java#L39
 SOURCE_INPUT_MATCH_BANDCAMP = re.compile(
-    r"^(https?://(?:[^.]+\.|)bandcamp\.com)/(track|album)/([a-zA-Z0-9-_]+)/?(?:\?.*|)$", re.IGNORECASE
+    r"^(https?://(?:[^.]+\.|)bandcamp\.com)/(track|album)/([a-zA-Z0-9-_]+)/?(?:\?.*|)$"
 )
 # https://github.com/lavalink-devs/lavaplayer/tree/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/nico/NicoAudioSourceManager.java#L47
-SOURCE_INPUT_MATCH_NICONICO = re.compile(
-    r"^(?:http://|https://|)(?:www\.|)nicovideo\.jp/watch/(.{2}[0-9]+)(?:\?.*|)$", re.IGNORECASE
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_NICONICO"] = (
+    r"^(?:http://|https://|)(?:www\.|)nicovideo\.jp/watch/(.{2}[0-9]+)(?:\?.*|)$",
+    0,
 )
 # https://github.com/lavalink-devs/lavaplayer/tree/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/twitch/TwitchStreamAudioSourceManager.java#L43
-SOURCE_INPUT_MATCH_TWITCH = re.compile(r"^https://(?:www\.|go\.|m\.)?twitch.tv/([^/]+)$", re.IGNORECASE)
+SOURCE_INPUT_MATCH_TWITCH = re.compile(r"^https://(?:www\.|go\.|m\.)?twitch.tv/([^/]+)$")
 # https://github.com/lavalink-devs/lavaplayer/tree/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/vimeo/VimeoAudioSourceManager.java#L39
-SOURCE_INPUT_MATCH_VIMEO = re.compile(r"^https://vimeo.com/[0-9]+(?:\?.*|)$", re.IGNORECASE)
+SOURCE_INPUT_MATCH_VIMEO = re.compile(r"^https://vimeo.com/[0-9]+(?:\?.*|)$")
 
 # noinspection LongLine
 # https://github.com/lavalink-devs/lavaplayer/blob/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/soundcloud/SoundCloudAudioSourceManager.java
+# The scheme, host and query string are shared by every URL shape, so they are matched once
 SOURCE_INPUT_MATCH_SOUND_CLOUD = re.compile(
-    r"^(?:http://|https://|)soundcloud\.app\.goo\.gl/([a-zA-Z0-9-_]+)/?(?:\?.*|)$|"
-    r"^(?:http://|https://|)(?:www\.|)(?:m\.|)soundcloud\.com/([a-zA-Z0-9-_]+)/([a-zA-Z0-9-_]+)/?(?:\?.*|)$|"
-    r"^https://on.soundcloud\.com/[a-zA-Z0-9-_]+/?(?:\?.*|)$|"
-    r"^(?:http://|https://|)(?:www\.|)(?:m\.|)soundcloud\.com/([a-zA-Z0-9-_]+)/([a-zA-Z0-9-_]+)/s-([a-zA-Z0-9-_]+)(?:\?.*|)$|"
-    r"^(?:http://|https://|)(?:www\.|)(?:m\.|)soundcloud\.com/([a-zA-Z0-9-_]+)/likes/?(?:\?.*|)$",
-    re.IGNORECASE,
+    r"^(?:https://on.soundcloud\.com/[a-zA-Z0-9-_]+/?|"
+    r"(?:http://|https://|)(?:"
+    r"soundcloud\.app\.goo\.gl/([a-zA-Z0-9-_]+)/?|"
+    r"(?:www\.|)(?:m\.|)soundcloud\.com/([a-zA-Z0-9-_]+)/(?:"
+    r"([a-zA-Z0-9-_]+)/?|"
+    r"([a-zA-Z0-9-_]+)/s-([a-zA-Z0-9-_]+)|"
+    r"likes/?"
+    r")))(?:\?.*|)$"
 )
 SOURCE_INPUT_MATCH_M3U = re.compile(r"^(?!http).*\.m3u8?$", re.IGNORECASE)
 SOURCE_INPUT_MATCH_PLS = re.compile(r"^.*\.pls$", re.IGNORECASE)
@@ -125,11 +134,10 @@ SOURCE_INPUT_MATCH_XSPF = re.compile(r"^.*\.xspf$", re.IGNORECASE)
 SOURCE_INPUT_MATCH_PYLAV = re.compile(r"^.*\.pylav$", re.IGNORECASE)
 # https://github.com/lavalink-devs/lavaplayer/tree/main/main/src/main/java/com/sedmelluq/discord/lavaplayer/source/youtube/DefaultYoutubeLinkRouter.java
 SOURCE_INPUT_MATCH_YOUTUBE = re.compile(
-    r"^(?:http://|https://|)(?:www\.|(?P<youtube_music>m\.|music\.)|)youtube\.com/.*", re.IGNORECASE
+    r"^(?:http://|https://|)(?:www\.|(?P<youtube_music>m\.|music\.)|)youtube\.com/.*"
 )
 SOURCE_INPUT_MATCH_YOUTUBE_SHORT = re.compile(
-    r"^(?:http://|https://|)(?:(?:www\.|(?P<youtube_music_short>m\.|music\.)|)youtube\.com/(?:live|embed|shorts)|(?:www\.|)youtu\.be)/(?P<YtmvideoId>.*)",
-    re.IGNORECASE,
+    r"^(?:http://|https://|)(?:(?:www\.|(?P<youtube_music_short>m\.|music\.)|)youtube\.com/(?:live|embed|shorts)|(?:www\.|)youtu\.be)/(?P<YtmvideoId>.*)"
 )
 SOURCE_INPUT_MATCH_SPEAK = re.compile(r"^(?P<speak_source>speak):\s*?(?P<speak_query>.*)$", re.IGNORECASE)
 # noinspection SpellCheckingInspection
@@ -142,14 +150,14 @@ SOURCE_INPUT_MATCH_SEARCH = re.compile(
     re.IGNORECASE,
 )
 SOURCE_INPUT_MATCH_HTTP = re.compile(r"^http(s)?://", re.IGNORECASE)
+SOURCE_INPUT_MATCH_HOST = re.compile(r"^(?:https?://)?(?P<host>[^/?#\s]+)")
 # https://github.com/topi314/LavaSrc/blob/master/main/src/main/java/com/github/topi314/lavasrc/deezer/DeezerAudioSourceManager.java#L35
 SOURCE_INPUT_MATCH_DEEZER = re.compile(
     r"^(https?://)?(www\.)?deezer\.com/"
     r"(?P<dzcountrycode>[a-zA-Z]{2}/)?"
     r"(?P<dztype>track|album|playlist|artist)/"
     r"(?P<dzidentifier>[0-9]+).*$|"
-    r"^(https?://)?(www\.)?deezer\.page\.link/.*$",
-    re.IGNORECASE,
+    r"^(https?://)?(www\.)?deezer\.page\.link/.*$"
 )
 # https://github.com/topi314/LavaSrc/blob/master/main/src/main/java/com/github/topi314/lavasrc/yandexmusic/YandexMusicSourceManager.java#L34
 SOURCE_INPUT_MATCH_YANDEX_TRACK = re.compile(
@@ -168,10 +176,15 @@ LOCAL_TRACK_NESTED = re.compile(
 SOURCE_INPUT_MATCH_LOCAL_TRACK_URI = re.compile(r"^file://(?P<local_file>.*)$", re.IGNORECASE)
 SOURCE_INPUT_MATCH_BASE64_TEST = re.compile(r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$")
 
-SOURCE_INPUT_MATCH_MERGED = re.compile(
+
+def _pattern(regex: re.Pattern[str] | str) -> str:
+    return _LAZY_PATTERNS[regex][0] if isinstance(regex, str) else regex.pattern
+
+
+_LAZY_PATTERNS["SOURCE_INPUT_MATCH_MERGED"] = (
     "|".join(
         [
-            r.pattern
+            _pattern(r)
             for r in [
                 SOURCE_INPUT_MATCH_SPOTIFY,
                 SOURCE_INPUT_MATCH_APPLE_MUSIC,
@@ -183,15 +196,15 @@ SOURCE_INPUT_MATCH_MERGED = re.compile(
                 SOURCE_INPUT_MATCH_FLOWERY_TSS,
                 SOURCE_INPUT_MATCH_SEARCH,
                 SOURCE_INPUT_MATCH_CLYPIT,
-                SOURCE_INPUT_MATCH_GETYARN,
-                SOURCE_INPUT_MATCH_MIXCLOUD,
-                SOURCE_INPUT_MATCH_OCRREMIX,
-                SOURCE_INPUT_MATCH_PORNHUB,
+                "SOURCE_INPUT_MATCH_GETYARN",
+                "SOURCE_INPUT_MATCH_MIXCLOUD",
+                "SOURCE_INPUT_MATCH_OCRREMIX",
+                "SOURCE_INPUT_MATCH_PORNHUB",
                 SOURCE_INPUT_MATCH_REDDIT,
-                SOURCE_INPUT_MATCH_SOUNDGASM,
-                SOURCE_INPUT_MATCH_TIKTOK,
+                "SOURCE_INPUT_MATCH_SOUNDGASM",
+                "SOURCE_INPUT_MATCH_TIKTOK",
                 SOURCE_INPUT_MATCH_BANDCAMP,
-                SOURCE_INPUT_MATCH_NICONICO,
+                "SOURCE_INPUT_MATCH_NICONICO",
                 SOURCE_INPUT_MATCH_TWITCH,
                 SOURCE_INPUT_MATCH_VIMEO,
                 SOURCE_INPUT_MATCH_SOUND_CLOUD,
@@ -208,8 +221,41 @@ SOURCE_INPUT_MATCH_MERGED = re.compile(
     re.IGNORECASE,
 )
 
+# Fused alternations, the name of the outer group that matched is exposed as `match.lastgroup`
+SOURCE_INPUT_MATCH_PLAYLIST_FILE = re.compile(
+    "|".join(
+        f"(?P<{name}>{r.pattern})"
+        for name, r in [
+            ("m3u", SOURCE_INPUT_MATCH_M3U),
+            ("pls", SOURCE_INPUT_MATCH_PLS),
+            ("pylav", SOURCE_INPUT_MATCH_PYLAV),
+        ]
+    ),
+    re.IGNORECASE,
+)
+SOURCE_INPUT_MATCH_URL_FALLBACK = re.compile(
+    "|".join(
+        f"(?P<{name}>{_pattern(r)})"
+        for name, r in [
+            ("ocremix", "SOURCE_INPUT_MATCH_OCRREMIX"),
+            ("http", SOURCE_INPUT_MATCH_HTTP),
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 TIMESTAMP_YOUTUBE = re.compile(r"[&?]t=(\d+)s?")
-TIMESTAMP_SPOTIFY = re.compile(r"#(\d+):(\d+)")
-TIMESTAMP_SOUNDCLOUD = re.compile(r"#t=(\d+):(\d+)s?")
-TIMESTAMP_TWITCH = re.compile(r"\?t=(\d+)h(\d+)m(\d+)s")
+_LAZY_PATTERNS["TIMESTAMP_SPOTIFY"] = (r"#(\d+):(\d+)", 0)
+_LAZY_PATTERNS["TIMESTAMP_SOUNDCLOUD"] = (r"#t=(\d+):(\d+)s?", 0)
+_LAZY_PATTERNS["TIMESTAMP_TWITCH"] = (r"\?t=(\d+)h(\d+)m(\d+)s", 0)
 YOUTUBE_TRACK_INDEX = re.compile(r"&index=(\d+)")
+
+
+def __getattr__(name: str) -> re.Pattern[str]:
+    try:
+        pattern, flags = _LAZY_PATTERNS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # Cache the compiled pattern as a module global so later lookups no longer reach this function
+    compiled = globals()[name] = re.compile(pattern, flags)
+    return compiled
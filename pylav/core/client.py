@@ -80,7 +80,7 @@ from pylav.nodes.node import Node
 from pylav.players.manager import PlayerController
 from pylav.players.player import Player
 from pylav.players.query.obj import Query
-from pylav.players.tracks.decoder import decode_track
+from pylav.players.tracks.decoder import async_decode_many, decode_track
 from pylav.players.tracks.obj import Track
 from pylav.storage.controllers.config import ConfigController
 from pylav.storage.controllers.equalizers import EqualizerController
@@ -968,11 +968,7 @@ class Client(metaclass=SingletonClass):
                 raise TypeError
             return response
         except Exception:  # noqa
-            response_tracks = []
-            for track in tracks:
-                with contextlib.suppress(Exception):
-                    response_tracks.append(decode_track(track))
-            return response_tracks
+            return await async_decode_many(tracks, raise_on_failure=False)
 
     @staticmethod
     async def routeplanner_status(node: Node) -> RoutePlannerStatus:
@@ -48,7 +48,7 @@ class SegmentsLoadedEvent(PyLavEvent):
     ----------
     player: :class:`Player`
         The player that loaded the segments.
-    segments: :class:`list[Segment]`
+    segments: :class:`tuple[Segment, ...]`
         The segments that were loaded.
     node: :class:`Node`
         The node that dispatched the event.
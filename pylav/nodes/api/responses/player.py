@@ -12,6 +12,10 @@ class State:
     ping: int
     position: int | None = 0
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> State:
+        return cls(time=data["time"], connected=data["connected"], ping=data["ping"], position=data.get("position", 0))
+
     def to_dict(self) -> JSON_DICT_TYPE:
         return {
             "time": self.time,
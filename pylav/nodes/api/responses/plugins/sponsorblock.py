@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
+import sys
 from typing import Literal
 
 from pylav.nodes.api.responses.websocket import Message
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
 
 __all__ = ("Segment", "SegmentsLoaded", "SegmentSkipped")
 
@@ -11,8 +13,12 @@ __all__ = ("Segment", "SegmentsLoaded", "SegmentSkipped")
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class Segment:
     category: str
-    start: str
-    end: str
+    start: float
+    end: float
+
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> Segment:
+        return cls(category=sys.intern(data["category"]), start=float(data["start"]), end=float(data["end"]))
 
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
@@ -20,14 +26,14 @@ class SegmentsLoaded(Message):
     op: Literal["event"] = "event"
     guildId: str | None = None
     type: Literal["SegmentsLoaded"] = "SegmentsLoaded"
-    segments: list[Segment | dict] = dataclasses.field(default_factory=list)
+    segments: tuple[Segment, ...] = ()
 
-    def __post_init__(self) -> None:
-        temp = []
-        for s in self.segments:
-            if isinstance(s, Segment) or (isinstance(s, dict) and (s := Segment(**s))):
-                temp.append(s)
-        object.__setattr__(self, "segments", temp)
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> SegmentsLoaded:
+        return cls(
+            guildId=data.get("guildId"),
+            segments=tuple(Segment.from_payload(s) for s in data.get("segments", ())),
+        )
 
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
@@ -35,8 +41,8 @@ class SegmentSkipped(Message):
     op: Literal["event"] = "event"
     guildId: str | None = None
     type: Literal["SegmentSkipped"] = "SegmentSkipped"
-    segment: Segment | dict = dataclasses.field(default_factory=dict)
+    segment: Segment
 
-    def __post_init__(self) -> None:
-        if isinstance(self.segment, dict):
-            object.__setattr__(self, "segment", Segment(**self.segment))
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> SegmentSkipped:
+        return cls(guildId=data.get("guildId"), segment=Segment.from_payload(data["segment"]))
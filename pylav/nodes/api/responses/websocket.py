@@ -6,6 +6,7 @@ from typing import Literal  # noqa
 from pylav.nodes.api.responses.exceptions import LavalinkException as TrackExceptionClass
 from pylav.nodes.api.responses.player import State
 from pylav.nodes.api.responses.track import Track
+from pylav.type_hints.dict_typing import JSON_DICT_TYPE
 
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
@@ -14,6 +15,10 @@ class CPU:
     systemLoad: float
     lavalinkLoad: float
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> CPU:
+        return cls(cores=data["cores"], systemLoad=data["systemLoad"], lavalinkLoad=data["lavalinkLoad"])
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class Memory:
@@ -22,6 +27,10 @@ class Memory:
     reservable: int
     used: int
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> Memory:
+        return cls(free=data["free"], allocated=data["allocated"], reservable=data["reservable"], used=data["used"])
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class Frame:
@@ -29,6 +38,10 @@ class Frame:
     nulled: int
     deficit: int
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> Frame:
+        return cls(sent=data["sent"], nulled=data["nulled"], deficit=data["deficit"])
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class Message:
@@ -40,6 +53,10 @@ class Ready(Message):
     sessionId: str
     resumed: bool
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> Ready:
+        return cls(op=data["op"], sessionId=data["sessionId"], resumed=data["resumed"])
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class Stats(Message):
@@ -54,12 +71,29 @@ class Stats(Message):
     def __post_init__(self) -> None:
         object.__setattr__(self, "uptime_seconds", self.uptime / 1000)
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> Stats:
+        frame_stats = data.get("frameStats")
+        return cls(
+            op=data["op"],
+            players=data["players"],
+            playingPlayers=data["playingPlayers"],
+            uptime=data["uptime"],
+            memory=Memory.from_payload(data["memory"]),
+            cpu=CPU.from_payload(data["cpu"]),
+            frameStats=Frame.from_payload(frame_stats) if frame_stats else None,
+        )
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class PlayerUpdate(Message):
     guildId: str
     state: State
 
+    @classmethod
+    def from_payload(cls, data: JSON_DICT_TYPE) -> PlayerUpdate:
+        return cls(op=data["op"], guildId=data["guildId"], state=State.from_payload(data["state"]))
+
 
 @dataclasses.dataclass(repr=True, frozen=True, kw_only=True, slots=True)
 class TrackStart(Message):
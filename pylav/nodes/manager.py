@@ -483,9 +483,10 @@ class NodeManager:
         """Disconnects all nodes and closes the session."""
         if self._player_migrate_task is not None:
             self._player_migrate_task.cancel()
-        await self.session.close()
+        # The node WebSockets share this session, so close them before it
         for node in iter(self.nodes):
             await node.close()
+        await self.session.close()
 
     async def connect_to_all_nodes(self) -> None:
         """Connects to all nodes."""
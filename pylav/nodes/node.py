@@ -541,7 +541,7 @@ class Node:
             case "search":
                 return from_dict(data_class=rest_api.SearchResponse, data=data)
 
-    async def get_unsupported_features(self) -> set[str]:
+    async def get_unsupported_features(self) -> frozenset[str]:
         """|coro|
         Returns the unsupported features of the target node.
         """
@@ -3,7 +3,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import functools
+import inspect
 import typing
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
@@ -48,6 +51,7 @@ from pylav.logging import getLogger
 from pylav.nodes.api.responses.plugins import SegmentSkipped, SegmentsLoaded
 from pylav.nodes.api.responses.websocket import (
     Closed,
+    Message,
     PlayerUpdate,
     Ready,
     Stats,
@@ -66,6 +70,52 @@ if typing.TYPE_CHECKING:
     from pylav.nodes.node import Node
     from pylav.players.player import Player
 
+# Newer aiohttp releases can hand text frames over as raw bytes, which every JSON backend parses directly,
+# so the frame isn't decoded to a str only to be parsed again
+_WS_CONNECT_KWARGS: dict[str, Any] = (
+    {"decode_text": False} if "decode_text" in inspect.signature(aiohttp.ClientSession.ws_connect).parameters else {}
+)
+
+# Players that report a dropped voice connection are only reconnected once they have been connected for this long
+_RECONNECT_GRACE = datetime.timedelta(minutes=5)
+
+# Track events carry a nested Track, so they are still built by dacite; they arrive far less often than stats updates
+_EVENT_PARSERS: dict[str, Callable[[JSON_DICT_TYPE], Message]] = {
+    "TrackStartEvent": functools.partial(from_dict, TrackStart),
+    "TrackEndEvent": functools.partial(from_dict, TrackEnd),
+    "TrackExceptionEvent": functools.partial(from_dict, TrackException),
+    "TrackStuckEvent": functools.partial(from_dict, TrackStuck),
+    "WebSocketClosedEvent": functools.partial(from_dict, Closed),
+    "SegmentsLoaded": SegmentsLoaded.from_payload,
+    "SegmentSkipped": SegmentSkipped.from_payload,
+}
+
+# Source name -> TrackStart event class dispatched for tracks from that source
+_TRACK_START_EVENTS: dict[str, type[TrackStartEvent]] = {
+    "YouTube Music": TrackStartYouTubeMusicEvent,
+    "YouTube": TrackStartYouTubeEvent,
+    "Spotify": TrackStartSpotifyEvent,
+    "Deezer": TrackStartDeezerEvent,
+    "Apple Music": TrackStartAppleMusicEvent,
+    "HTTP": TrackStartHTTPEvent,
+    "SoundCloud": TrackStartSoundCloudEvent,
+    "Clyp.it": TrackStartClypitEvent,
+    "Twitch": TrackStartTwitchEvent,
+    "Bandcamp": TrackStartBandcampEvent,
+    "Vimeo": TrackStartVimeoEvent,
+    "speak": TrackStartSpeakEvent,
+    "GetYarn": TrackStartGetYarnEvent,
+    "Mixcloud": TrackStartMixCloudEvent,
+    "OverClocked ReMix": TrackStartOCRMixEvent,
+    "Pornhub": TrackStartPornHubEvent,
+    "Reddit": TrackStartRedditEvent,
+    "SoundGasm": TrackStartSoundgasmEvent,
+    "TikTok": TrackStartTikTokEvent,
+    "Google TTS": TrackStartGCTTSEvent,
+    "Niconico": TrackStartNicoNicoEvent,
+    "Yandex Music": TrackStartYandexMusicEvent,
+}
+
 
 class WebSocket:
     """Represents the WebSocket connection with Lavalink"""
@@ -77,6 +127,7 @@ class WebSocket:
         "_host",
         "_port",
         "_password",
+        "_headers",
         "_ssl",
         "_max_reconnect_attempts",
         "_resume_timeout",
@@ -85,6 +136,7 @@ class WebSocket:
         "_client",
         "ready",
         "_connect_task",
+        "_reconnect",
         "_manual_shutdown",
         "_session_id",
         "_resumed",
@@ -109,11 +161,17 @@ class WebSocket:
         self._logger = getLogger(f"PyLav.WebSocket-{self.node.name}")
         self._client = self._node.node_manager.client
 
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120), json_serialize=json.dumps)
+        # The session is shared by every node's WebSocket and is closed by the node manager
+        self._session = self._node.node_manager.session
         self._ws = None
         self._host = host
         self._port = port
         self._password = password
+        self._headers = {
+            "Authorization": password,
+            "User-Id": str(self.bot_id),
+            "Client-Name": f"PyLav/{self.lib_version}",
+        }
         self._ssl = ssl
         self._max_reconnect_attempts = reconnect_attempts
 
@@ -129,11 +187,12 @@ class WebSocket:
             aiohttp.WSMsgType.CLOSED,
         )
         self.ready = asyncio.Event()
-        self._connect_task = asyncio.ensure_future(self.connect())
+        self._reconnect = False
+        self._connect_task = asyncio.ensure_future(self._connect_loop())
         self._connect_task.add_done_callback(self._done_callback)
         self._manual_shutdown = False
         self._connecting = False
-        self._player_reconnect_tasks: dict[int : asyncio.Task] = {}
+        self._player_reconnect_tasks: dict[int, asyncio.Task] = {}
 
     def _done_callback(self, task: asyncio.Task) -> None:
         with contextlib.suppress(asyncio.CancelledError):
@@ -215,6 +274,13 @@ class WebSocket:
         self._resuming_configured = self._session_id is not None
         self._logger.info("Node resume has been configured with sessionId: %s", self._session_id)
 
+    async def _connect_loop(self) -> None:
+        """Connects to Lavalink, reconnecting in place whenever the listener asks for it"""
+        self._reconnect = True
+        while self._reconnect:
+            self._reconnect = False
+            await self.connect()
+
     async def connect(self) -> None:  # sourcery skip: low-code-quality
         """Attempts to establish a connection to Lavalink"""
         try:
@@ -223,11 +289,7 @@ class WebSocket:
             if self.client.is_shutting_down:
                 return
             self._connecting = True
-            headers = {
-                "Authorization": self._password,
-                "User-Id": str(self.bot_id),
-                "Client-Name": f"PyLav/{self.lib_version}",
-            }
+            headers = self._headers
             if self._node.identifier in PYLAV_NODES:
                 # Since these nodes are proxied by Cloudflare - lets add a special case to properly identify them.
                 self._node._region, self._node._coordinates = PYLAV_NODES[self._node.identifier]
@@ -261,10 +323,12 @@ class WebSocket:
                     )
                     raise OSError
                 if self._session_id is not None:
-                    headers["Session-Id"] = self._session_id
+                    headers = {**self._headers, "Session-Id": self._session_id}
                 ws_uri = self.node.get_endpoint_websocket()
                 try:
-                    self._ws = await self._session.ws_connect(url=ws_uri, headers=headers, heartbeat=60, timeout=600)
+                    self._ws = await self._session.ws_connect(
+                        url=ws_uri, headers=headers, heartbeat=60, timeout=600, **_WS_CONNECT_KWARGS
+                    )
                     await self._node.update_features()
                     self._connecting = False
                     backoff.reset()
@@ -324,7 +388,6 @@ class WebSocket:
             self._connecting = False
             if self._ws and not self._ws.closed and not self._ws._closing:
                 await self._ws.close(code=4014, message=b"Shutting down")
-            await self._session.close()
             self.ready.set()
             self.node._ready.set()
             self._connect_task.cancel()
@@ -348,8 +411,10 @@ class WebSocket:
                     )
                     await self._websocket_closed(msg.data, msg.extra)
                     return
+                elif msg.type == aiohttp.WSMsgType.TEXT or msg.type == aiohttp.WSMsgType.BINARY:
+                    await self.handle_message(json.loads(msg.data))
                 else:
-                    await self.handle_message(msg.json(loads=json.loads))
+                    self._logger.warning("Received unexpected WebSocket message of type %s: %s", msg.type, msg.data)
                 # elif msg.type == aiohttp.WSMsgType.ERROR and not self.client.is_shutting_down:
                 #     exc = self._ws.exception()
                 #     self._logger.error("Exception in WebSocket! %s", exc)
@@ -378,12 +443,16 @@ class WebSocket:
         )
         self._ws = None
         await self.node.node_manager.node_disconnect(self.node, code, reason)
+        if not self._manual_shutdown and asyncio.current_task() is self._connect_task:
+            # Called by the listener, the connect loop reconnects once it unwinds, so reuse its task
+            self._reconnect = True
+            return
         if not self._connect_task.cancelled():
             self._connect_task.cancel()
         if self._manual_shutdown:
             await self.close()
             return
-        self._connect_task = asyncio.ensure_future(self.connect())
+        self._connect_task = asyncio.ensure_future(self._connect_loop())
         self._connect_task.add_done_callback(self._done_callback)
 
     async def handle_message(self, data: JSON_DICT_TYPE) -> None:
@@ -395,38 +464,22 @@ class WebSocket:
         data: LavalinkPlayerUpdateT|LavalinkEventT| LavalinkStatsT| LavalinkReadyT
             The data given from Lavalink.
         """
-        match data["op"]:
+        op = data["op"]
+        match op:
             case "playerUpdate":
-                data = from_dict(data_class=PlayerUpdate, data=data)
-                await self.handle_player_update(data)
+                await self.handle_player_update(PlayerUpdate.from_payload(data))
             case "stats":
-                data = from_dict(data_class=Stats, data=data)
-                await self.handle_stats(data)
+                await self.handle_stats(Stats.from_payload(data))
             case "event":
-                match data["type"]:
-                    case "TrackStartEvent":
-                        data = from_dict(data_class=TrackStart, data=data)
-                    case "TrackEndEvent":
-                        data = from_dict(data_class=TrackEnd, data=data)
-                    case "TrackExceptionEvent":
-                        data = from_dict(data_class=TrackException, data=data)
-                    case "TrackStuckEvent":
-                        data = from_dict(data_class=TrackStuck, data=data)
-                    case "WebSocketClosedEvent":
-                        data = from_dict(data_class=Closed, data=data)
-                    case "SegmentsLoaded":
-                        data = from_dict(data_class=SegmentsLoaded, data=data)
-                    case "SegmentSkipped":
-                        data = from_dict(data_class=SegmentSkipped, data=data)
-                    case __:
-                        self._logger.warning("Received unknown event: %s - ignoring it", data["type"])
-                        return
-                await self.handle_event(data)
+                event_type = data["type"]
+                if (parser := _EVENT_PARSERS.get(event_type)) is None:
+                    self._logger.warning("Received unknown event: %s - ignoring it", event_type)
+                    return
+                await self.handle_event(parser(data))
             case "ready":
-                data = from_dict(data_class=Ready, data=data)
-                await self.handle_ready(data)
+                await self.handle_ready(Ready.from_payload(data))
             case __:
-                self._logger.warning("Received unknown op: %s", data["op"])
+                self._logger.warning("Received unknown op: %s", op)
 
     async def handle_stats(self, data: Stats) -> None:
         """
@@ -455,16 +508,23 @@ class WebSocket:
                 (not data.state.connected)
                 and player.is_active
                 and self.ready.is_set()
-                and player.connected_at < get_now_utc() - datetime.timedelta(minutes=5)
+                and player.connected_at < get_now_utc() - _RECONNECT_GRACE
             ):
                 if player.guild.id in self._player_reconnect_tasks:
                     self._player_reconnect_tasks[player.guild.id].cancel()
-                self._player_reconnect_tasks[player.guild.id] = asyncio.create_task(self.maybe_reconnect_player(player))
+                task = asyncio.create_task(self.maybe_reconnect_player(player))
+                task.add_done_callback(functools.partial(self._discard_reconnect_task, player.guild.id))
+                self._player_reconnect_tasks[player.guild.id] = task
                 return
             await player._update_state(data.state)
         else:
             return
 
+    def _discard_reconnect_task(self, guild_id: int, task: asyncio.Task) -> None:
+        # A cancelled task finishes after its replacement has been stored, so only drop the entry if it is still ours
+        if self._player_reconnect_tasks.get(guild_id) is task:
+            del self._player_reconnect_tasks[guild_id]
+
     async def maybe_reconnect_player(self, player: Player) -> None:
         """
         Attempts to reconnect the player if it is not connected.
@@ -483,7 +543,7 @@ class WebSocket:
             (not session.state.connected)
             and player.is_active
             and self.ready.is_set()
-            and player.connected_at < get_now_utc() - datetime.timedelta(minutes=5)
+            and player.connected_at < get_now_utc() - _RECONNECT_GRACE
         ):
             self._logger.debug("Reconnecting stalled player for %s", player.guild.id)
             await player.reconnect()
@@ -524,10 +584,11 @@ class WebSocket:
         """
         if self.client.is_shutting_down:
             return
-        player = self.client.player_manager.get(int(data.guildId))
+        guild_id = int(data.guildId)
+        player = self.client.player_manager.get(guild_id)
         if not player:
             await asyncio.sleep(3)
-            player = self.client.player_manager.get(int(data.guildId))
+            player = self.client.player_manager.get(guild_id)
         if not player:
             self._logger.debug(
                 "Received event for non-existent player! Guild ID: %s",
@@ -583,12 +644,12 @@ class WebSocket:
     async def _get_track(self, data, player) -> Track | None:
         if not isinstance(data, (TrackStart, TrackEnd, TrackException, TrackStuck)):
             return
-        requester = None
         if player.current and player.current.encoded == data.track.encoded:
-            requester = player.current.requester
+            # The event is for the loaded track, so there is no need to rebuild it (and re-parse its query)
+            return player.current
         return await Track.build_track(
             data=data.track,
-            requester=requester.id if requester else self._client.bot.user.id,
+            requester=self._client.bot.user.id,
             query=None,
             node=self.node,
             player_instance=player,
@@ -617,66 +678,18 @@ class WebSocket:
     async def _process_track_event(self, player: Player, track: Track, node: Node, event_object: TrackStart) -> None:
         query = await track.query()
 
-        match query.source:
-            case "YouTube Music":
-                event = TrackStartYouTubeMusicEvent(player, track, node, event_object)
-            case "YouTube":
-                event = TrackStartYouTubeEvent(player, track, node, event_object)
-            case "Spotify":
-                event = TrackStartSpotifyEvent(player, track, node, event_object)
-            case "Deezer":
-                event = TrackStartDeezerEvent(player, track, node, event_object)
-            case "Apple Music":
-                event = TrackStartAppleMusicEvent(player, track, node, event_object)
-            case "HTTP":
-                event = TrackStartHTTPEvent(player, track, node, event_object)
-            case "SoundCloud":
-                event = TrackStartSoundCloudEvent(player, track, node, event_object)
-            case "Clyp.it":
-                event = TrackStartClypitEvent(player, track, node, event_object)
-            case "Twitch":
-                event = TrackStartTwitchEvent(player, track, node, event_object)
-            case "Bandcamp":
-                event = TrackStartBandcampEvent(player, track, node, event_object)
-            case "Vimeo":
-                event = TrackStartVimeoEvent(player, track, node, event_object)
-            case "speak":
-                event = TrackStartSpeakEvent(player, track, node, event_object)
-            case "GetYarn":
-                event = TrackStartGetYarnEvent(player, track, node, event_object)
-            case "Mixcloud":
-                event = TrackStartMixCloudEvent(player, track, node, event_object)
-            case "OverClocked ReMix":
-                event = TrackStartOCRMixEvent(player, track, node, event_object)
-            case "Pornhub":
-                event = TrackStartPornHubEvent(player, track, node, event_object)
-            case "Reddit":
-                event = TrackStartRedditEvent(player, track, node, event_object)
-            case "SoundGasm":
-                event = TrackStartSoundgasmEvent(player, track, node, event_object)
-            case "TikTok":
-                event = TrackStartTikTokEvent(player, track, node, event_object)
-            case "Google TTS":
-                event = TrackStartGCTTSEvent(player, track, node, event_object)
-            case "Niconico":
-                event = TrackStartNicoNicoEvent(player, track, node, event_object)
-            case "Yandex Music":
-                event = TrackStartYandexMusicEvent(player, track, node, event_object)
-            case __:
-                if query.source == "Local" or (
-                    query._special_local and (query.is_m3u or query.is_pls or query.is_pylav)
-                ):
-                    event = TrackStartLocalFileEvent(player, track, node, event_object)
-                else:
-                    event = TrackStartEvent(player, track, node, event_object)
-        self.client.dispatch_event(event)
+        if (event_cls := _TRACK_START_EVENTS.get(query.source)) is None:
+            if query.source == "Local" or (query._special_local and (query.is_m3u or query.is_pls or query.is_pylav)):
+                event_cls = TrackStartLocalFileEvent
+            else:
+                event_cls = TrackStartEvent
+        self.client.dispatch_event(event_cls(player, track, node, event_object))
 
     async def close(self) -> None:
         """Closes the websocket connection."""
         self._connect_task.cancel()
         if self._ws and not self._ws.closed and not self._ws._closing:
             await self._ws.close(code=4014, message=b"Shutting down")
-        await self._session.close()
 
     async def manual_closure(self, managed_node: bool = False) -> None:
         """Triggers a manual closure of the websocket connection."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import gzip
 import pathlib
 import typing
@@ -15,7 +16,7 @@ import discord
 import yaml
 
 from pylav.compat import json
-from pylav.constants import MAX_RECURSION_DEPTH
+from pylav.constants import MAX_RECURSION_DEPTH, regex
 from pylav.constants.config import DEFAULT_SEARCH_SOURCE
 from pylav.constants.node_features import SUPPORTED_SEARCHES
 from pylav.constants.regex import (
@@ -27,25 +28,18 @@ from pylav.constants.regex import (
     SOURCE_INPUT_MATCH_DEEZER,
     SOURCE_INPUT_MATCH_FLOWERY_TSS,
     SOURCE_INPUT_MATCH_GCTSS,
-    SOURCE_INPUT_MATCH_GETYARN,
-    SOURCE_INPUT_MATCH_HTTP,
+    SOURCE_INPUT_MATCH_HOST,
     SOURCE_INPUT_MATCH_LOCAL_TRACK_URI,
-    SOURCE_INPUT_MATCH_M3U,
-    SOURCE_INPUT_MATCH_MIXCLOUD,
-    SOURCE_INPUT_MATCH_NICONICO,
-    SOURCE_INPUT_MATCH_OCRREMIX,
+    SOURCE_INPUT_MATCH_PLAYLIST_FILE,
     SOURCE_INPUT_MATCH_PLS,
     SOURCE_INPUT_MATCH_PLS_TRACK,
-    SOURCE_INPUT_MATCH_PORNHUB,
-    SOURCE_INPUT_MATCH_PYLAV,
     SOURCE_INPUT_MATCH_REDDIT,
     SOURCE_INPUT_MATCH_SEARCH,
     SOURCE_INPUT_MATCH_SOUND_CLOUD,
-    SOURCE_INPUT_MATCH_SOUNDGASM,
     SOURCE_INPUT_MATCH_SPEAK,
     SOURCE_INPUT_MATCH_SPOTIFY,
-    SOURCE_INPUT_MATCH_TIKTOK,
     SOURCE_INPUT_MATCH_TWITCH,
+    SOURCE_INPUT_MATCH_URL_FALLBACK,
     SOURCE_INPUT_MATCH_VIMEO,
     SOURCE_INPUT_MATCH_YANDEX,
     SOURCE_INPUT_MATCH_YOUTUBE,
@@ -60,20 +54,189 @@ if typing.TYPE_CHECKING:
 
 __CLIENT: Client | None = None
 
+# Non-URL inputs are keyed on the text before the first ":", URLs on their host
+# (with a single leading subdomain stripped if the full host is unknown),
+# so each query is only checked against the patterns of the source it can belong to.
+_PREFIX_SOURCES: dict[str, str] = {
+    "tts": "gctts",
+    "ftts": "flowery_tts",
+    "speak": "speak",
+}
+_HOST_SOURCES: dict[str, str] = {
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "open.spotify.com": "spotify",
+    "music.apple.com": "apple_music",
+    "deezer.com": "deezer",
+    "deezer.page.link": "deezer",
+    "soundcloud.com": "soundcloud",
+    "m.soundcloud.com": "soundcloud",
+    "on.soundcloud.com": "soundcloud",
+    "soundcloud.app.goo.gl": "soundcloud",
+    "twitch.tv": "twitch",
+    "clyp.it": "clypit",
+    "getyarn.io": "getyarn",
+    "mixcloud.com": "mixcloud",
+    "pornhub.com": "pornhub",
+    "pornhub.net": "pornhub",
+    "pornhub.org": "pornhub",
+    "reddit.com": "reddit",
+    "v.redd.it": "reddit",
+    "soundgasm.net": "soundgasm",
+    "tiktok.com": "tiktok",
+    "bandcamp.com": "bandcamp",
+    "nicovideo.jp": "niconico",
+    "vimeo.com": "vimeo",
+    "music.yandex.ru": "yandex_music",
+    "music.yandex.com": "yandex_music",
+    "music.yandex.kz": "yandex_music",
+    "music.yandex.by": "yandex_music",
+}
+_SEARCH_SOURCES: dict[str, str] = {
+    "ytm": "YouTube Music",
+    "yt": "YouTube",
+    "sp": "Spotify",
+    "sc": "SoundCloud",
+    "am": "Apple Music",
+    "dz": "Deezer",
+    "ym": "Yandex Music",
+}
+_SEARCH_PREFIXES: dict[str, str] = {
+    "YouTube Music": "ytmsearch:",
+    "YouTube": "ytsearch:",
+    "Spotify": "spsearch:",
+    "Apple Music": "amsearch:",
+    "SoundCloud": "scsearch:",
+    "Deezer": "dzsearch:",
+    "Google TTS": "tts://",
+    "Flowery TTS": "ftts://",
+    "Yandex Music": "ymsearch:",
+    "LavaSearch": "lavasearch:",
+}
+_DEFAULT_SEARCH_PREFIX = f"{DEFAULT_SEARCH_SOURCE}:"
+# "Local" isn't listed in the tables below as it is resolved through `Query.is_local`
+_SOURCE_CAPABILITIES: dict[str, str] = {
+    "Spotify": "spotify",
+    "Apple Music": "applemusic",
+    "YouTube": "youtube",
+    "YouTube Music": "youtube",
+    "SoundCloud": "soundcloud",
+    "Twitch": "twitch",
+    "Bandcamp": "bandcamp",
+    "HTTP": "http",
+    "speak": "speak",
+    "Google TTS": "gcloud-tts",
+    "Flowery TTS": "flowery-tts",
+    "GetYarn": "getyarn.io",
+    "Clyp.it": "clypit",
+    "Pornhub": "pornhub",
+    "Reddit": "reddit",
+    "OverClocked ReMix": "ocremix",
+    "TikTok": "tiktok",
+    "Mixcloud": "mixcloud",
+    "SoundGasm": "soundgasm",
+    "Vimeo": "vimeo",
+    "Deezer": "deezer",
+    "Yandex Music": "yandexmusic",
+    "LavaSearch": "lavasearch",
+}
+_SOURCE_ABBREVIATIONS: dict[str, str] = {
+    "Spotify": "SP",
+    "Apple Music": "AM",
+    "YouTube": "YT",
+    "YouTube Music": "YT",
+    "SoundCloud": "SC",
+    "Twitch": "TW",
+    "Bandcamp": "BC",
+    "HTTP": "HTTP",
+    "speak": "TTS",
+    "Google TTS": "TTS",
+    "Flowery TTS": "TTS",
+    "GetYarn": "GY",
+    "Clyp.it": "CI",
+    "Pornhub": "PH",
+    "Reddit": "RD",
+    "OverClocked ReMix": "OCR",
+    "TikTok": "TT",
+    "Mixcloud": "MX",
+    "SoundGasm": "SG",
+    "Vimeo": "VM",
+    "Deezer": "DZ",
+    "Yandex Music": "YDM",
+}
+# Aliases accepted by the `Query.source` setter
+_SOURCE_ALIASES: dict[str, str] = {
+    "ytm": "YouTube Music",
+    "yt": "YouTube",
+    "sp": "Spotify",
+    "sc": "SoundCloud",
+    "am": "Apple Music",
+    "local": "Local",
+    "speak": "speak",
+    "tts://": "Google TTS",
+    "dz": "Deezer",
+    "lavasearch": "LavaSearch",
+}
+# Lavalink source manager names
+_SOURCE_NAMES: dict[str, str] = {
+    "spotify": "Spotify",
+    "youtube": "YouTube Music",
+    "soundcloud": "SoundCloud",
+    "deezer": "Deezer",
+    "applemusic": "Apple Music",
+    "local": "Local",
+    "speak": "speak",
+    "gcloud-tts": "Google TTS",
+    "http": "HTTP",
+    "twitch": "Twitch",
+    "vimeo": "Vimeo",
+    "bandcamp": "Bandcamp",
+    "mixcloud": "Mixcloud",
+    "getyarn.io": "GetYarn",
+    "ocremix": "OverClocked ReMix",
+    "reddit": "Reddit",
+    "clypit": "Clyp.it",
+    "pornhub": "PornHub",
+    "soundgasm": "SoundGasm",
+    "tiktok": "TikTok",
+    "niconico": "Niconico",
+    "yandexmusic": "Yandex Music",
+}
+_FALLBACK_SOURCES: dict[str, str] = {
+    "ocremix": "OverClocked ReMix",
+    "http": "HTTP",
+}
+_PLAYLIST_FILE_SOURCES: dict[str, str] = {
+    "m3u": "M3U",
+    "pls": "PLS",
+    "pylav": "PyLav",
+}
+
+
+def _get_url_source(lowered_query: str) -> str | None:
+    if (source := _PREFIX_SOURCES.get(lowered_query.partition(":")[0])) is not None:
+        return source
+    if (match := SOURCE_INPUT_MATCH_HOST.match(lowered_query)) is None:
+        return None
+    host = match.group("host")
+    if (source := _HOST_SOURCES.get(host)) is None:
+        source = _HOST_SOURCES.get(host.partition(".")[2])
+    return source
+
 
 # noinspection SpellCheckingInspection
 class Query:
     __slots__ = (
         "_query",
         "_source",
-        "_start_time",
         "_search",
         "start_time",
         "index",
         "_type",
         "_recursive",
         "_special_local",
-        "_local_file_cls",
+        "_string_cache",
+        "_folder_cache",
     )
     __local_file_cls: type[LocalFile] = LocalFile
     __CLIENT: Client | None = None
@@ -97,9 +260,9 @@ class Query:
         self._type = query_type or "single"
         self._recursive = recursive
         self._special_local = special_local
-
-        self._local_file_cls = LocalFile
-        self.update_local_file_cls(LocalFile)
+        # `_query` is never reassigned, so the rendered strings and the folder name can be reused
+        self._string_cache: dict[tuple[int, bool], str] | None = None
+        self._folder_cache: str | None = None
 
     @property
     def client(self) -> Client:
@@ -293,32 +456,11 @@ class Query:
 
     @property
     def query_identifier(self) -> str:
-        if self.is_search:
+        if self._search:
             assert isinstance(self._query, str)
-            if self.is_youtube_music:
-                return f"ytmsearch:{self._query}"
-            elif self.is_youtube:
-                return f"ytsearch:{self._query}"
-            elif self.is_spotify:
-                return f"spsearch:{self._query}"
-            elif self.is_apple_music:
-                return f"amsearch:{self._query}"
-            elif self.is_soundcloud:
-                return f"scsearch:{self._query}"
-            elif self.is_deezer:
-                return f"dzsearch:{self._query}"
-            elif self.is_speak:
+            if self._source == "speak":
                 return f"speak:{self._query[:200]}"
-            elif self.is_gctts:
-                return f"tts://{self._query}"
-            elif self.is_flowery_tts:
-                return f"ftts://{self._query}"
-            elif self.is_yandex_music:
-                return f"ymsearch:{self._query}"
-            elif self.is_lavasearch:
-                return f"lavasearch:{self._query}"
-            else:
-                return f"{DEFAULT_SEARCH_SOURCE}:{self._query}"
+            return f"{_SEARCH_PREFIXES.get(self._source, _DEFAULT_SEARCH_PREFIX)}{self._query}"
         elif self.is_local:
             return f"{getattr(self._query, 'path', self._query)}"
         assert isinstance(self._query, str)
@@ -326,59 +468,98 @@ class Query:
 
     @classmethod
     def __process_urls(cls, query: str) -> Query | None:  # sourcery skip: low-code-quality
-        if (match := SOURCE_INPUT_MATCH_YOUTUBE.match(query)) or (
-            match := SOURCE_INPUT_MATCH_YOUTUBE_SHORT.match(query)
-        ):
-            groups = match.groupdict()
-            music = groups.get("youtube_music") or groups.get("youtube_music_short")
-            return process_youtube(cls, query, music=bool(music))
-        elif SOURCE_INPUT_MATCH_SPOTIFY.match(query):
-            return process_spotify(cls, query)
-        elif match := SOURCE_INPUT_MATCH_APPLE_MUSIC.match(query):
-            return cls.process_applemusic(match, query)
-        elif SOURCE_INPUT_MATCH_DEEZER.match(query):
-            return process_deezer(cls, query)
-        elif SOURCE_INPUT_MATCH_SOUND_CLOUD.match(query):
-            return process_soundcloud(cls, query)
-        elif SOURCE_INPUT_MATCH_TWITCH.match(query):
-            return cls(query, "Twitch")
-        elif match := SOURCE_INPUT_MATCH_GCTSS.match(query):
-            query = match.group("gctts_query").strip()
-            return cls(query, "Google TTS", search=True)
-        elif match := SOURCE_INPUT_MATCH_FLOWERY_TSS.match(query):
-            query = match.group("flowery_tts_query").strip()
-            return cls(query, "Flowery TTS", search=True)
-        elif match := SOURCE_INPUT_MATCH_SPEAK.match(query):
-            query = match.group("speak_query").strip()
-            return cls(query, "speak", search=True)
-        elif SOURCE_INPUT_MATCH_CLYPIT.match(query):
-            return cls(query, "Clyp.it")
-        elif SOURCE_INPUT_MATCH_GETYARN.match(query):
-            return cls(query, "GetYarn")
-        elif match := SOURCE_INPUT_MATCH_MIXCLOUD.match(query):
-            return cls.process_mixcloud(match, query)
-        elif SOURCE_INPUT_MATCH_OCRREMIX.match(query):
-            return cls(query, "OverClocked ReMix")
-        elif SOURCE_INPUT_MATCH_PORNHUB.match(query):
-            return cls(query, "Pornhub")
-        elif SOURCE_INPUT_MATCH_REDDIT.match(query):
-            return cls(query, "Reddit")
-        elif SOURCE_INPUT_MATCH_SOUNDGASM.match(query):
-            return cls(query, "SoundGasm")
-        elif SOURCE_INPUT_MATCH_TIKTOK.match(query):
-            return cls(query, "TikTok")
-        elif SOURCE_INPUT_MATCH_BANDCAMP.match(query):
-            return process_bandcamp(cls, query)
-        elif SOURCE_INPUT_MATCH_NICONICO.match(query):
-            return cls(query, "Niconico")
-        elif SOURCE_INPUT_MATCH_VIMEO.match(query):
-            return cls(query, "Vimeo")
-        elif SOURCE_INPUT_MATCH_YANDEX.match(query):
-            return process_yandex_music(cls, query)
-        elif SOURCE_INPUT_MATCH_HTTP.match(query):
-            return cls(query, "HTTP")
+        # The URL patterns are case-sensitive and written for lowercase input, so fold the case once up front
+        lowered = query.lower()
+        match _get_url_source(lowered):
+            case "youtube":
+                if (match := SOURCE_INPUT_MATCH_YOUTUBE.match(lowered)) or (
+                    match := SOURCE_INPUT_MATCH_YOUTUBE_SHORT.match(lowered)
+                ):
+                    groups = match.groupdict()
+                    music = groups.get("youtube_music") or groups.get("youtube_music_short")
+                    return process_youtube(cls, query, music=bool(music))
+            case "spotify":
+                if SOURCE_INPUT_MATCH_SPOTIFY.match(lowered):
+                    return process_spotify(cls, query)
+            case "apple_music":
+                if match := SOURCE_INPUT_MATCH_APPLE_MUSIC.match(lowered):
+                    return cls.process_applemusic(match, query)
+            case "deezer":
+                if SOURCE_INPUT_MATCH_DEEZER.match(lowered):
+                    return process_deezer(cls, query)
+            case "soundcloud":
+                if SOURCE_INPUT_MATCH_SOUND_CLOUD.match(lowered):
+                    return process_soundcloud(cls, query)
+            case "twitch":
+                if SOURCE_INPUT_MATCH_TWITCH.match(lowered):
+                    return cls(query, "Twitch")
+            case "gctts":
+                if match := SOURCE_INPUT_MATCH_GCTSS.match(query):
+                    query = match.group("gctts_query").strip()
+                    return cls(query, "Google TTS", search=True)
+            case "flowery_tts":
+                if match := SOURCE_INPUT_MATCH_FLOWERY_TSS.match(query):
+                    query = match.group("flowery_tts_query").strip()
+                    return cls(query, "Flowery TTS", search=True)
+            case "speak":
+                if match := SOURCE_INPUT_MATCH_SPEAK.match(query):
+                    query = match.group("speak_query").strip()
+                    return cls(query, "speak", search=True)
+            case "clypit":
+                if SOURCE_INPUT_MATCH_CLYPIT.match(lowered):
+                    return cls(query, "Clyp.it")
+            case "getyarn":
+                if regex.SOURCE_INPUT_MATCH_GETYARN.match(lowered):
+                    return cls(query, "GetYarn")
+            case "mixcloud":
+                if match := regex.SOURCE_INPUT_MATCH_MIXCLOUD.match(lowered):
+                    return cls.process_mixcloud(match, query)
+            case "pornhub":
+                if regex.SOURCE_INPUT_MATCH_PORNHUB.match(lowered):
+                    return cls(query, "Pornhub")
+            case "reddit":
+                if SOURCE_INPUT_MATCH_REDDIT.match(lowered):
+                    return cls(query, "Reddit")
+            case "soundgasm":
+                if regex.SOURCE_INPUT_MATCH_SOUNDGASM.match(lowered):
+                    return cls(query, "SoundGasm")
+            case "tiktok":
+                if regex.SOURCE_INPUT_MATCH_TIKTOK.match(lowered):
+                    return cls(query, "TikTok")
+            case "bandcamp":
+                if SOURCE_INPUT_MATCH_BANDCAMP.match(lowered):
+                    return process_bandcamp(cls, query)
+            case "niconico":
+                if regex.SOURCE_INPUT_MATCH_NICONICO.match(lowered):
+                    return cls(query, "Niconico")
+            case "vimeo":
+                if SOURCE_INPUT_MATCH_VIMEO.match(lowered):
+                    return cls(query, "Vimeo")
+            case "yandex_music":
+                if SOURCE_INPUT_MATCH_YANDEX.match(query):
+                    return process_yandex_music(cls, query)
+        # OverClocked ReMix also accepts bare "OCR<id>" queries, so it can't be keyed on a host
+        if match := SOURCE_INPUT_MATCH_URL_FALLBACK.match(query):
+            return cls(query, _FALLBACK_SOURCES[match.lastgroup])
         return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __classify(query: str) -> tuple[str, str, bool, int, int, str] | None:
+        # Cache the constructor arguments rather than the Query itself, as Query objects are mutable
+        if (output := Query.__process_urls(query)) is None and (output := Query.__process_search(query)) is None:
+            return None
+        return output._query, output._source, output._search, output.start_time, output.index, output._type
+
+    @classmethod
+    def __process_string(cls, query: str) -> Query | None:
+        if (arguments := cls.__classify(query)) is None:
+            return None
+        query, source, search, start_time, index, query_type = arguments
+        output = cls(query, source, search=search, index=index, query_type=query_type)
+        output.start_time = start_time
+        return output
+
     @classmethod
     def process_applemusic(cls, match: typing.Match[str], query: str) -> Query:
         query_type = match.group("type")
@@ -405,28 +586,21 @@ class Query:
 
     @classmethod
     def __process_search(cls, query: str) -> Query | None:
+        # Every search prefix ("dzisrc:" through "lavasearch:") puts its first colon at index 6 to 10,
+        # which rules out plain text and URLs without running the regex
+        if not 5 < query.find(":", 0, 11):
+            return None
         if match := SOURCE_INPUT_MATCH_SEARCH.match(query):
             query = match.group("search_query")
             deezer = (not query) and (query := match.group("search_deezer_isrc"))
             query = query.strip()
             if deezer:
                 return cls(query, "Deezer", search=True)
-            elif match.group("search_source") == "ytm":
-                return cls(query, "YouTube Music", search=True)
-            elif match.group("search_source") == "yt":
-                return cls(query, "YouTube", search=True)
-            elif match.group("search_source") == "sp":
-                return cls(query, "Spotify", search=True)
-            elif match.group("search_source") == "sc":
-                return cls(query, "SoundCloud", search=True)
-            elif match.group("search_source") == "am":
-                return cls(query, "Apple Music", search=True)
-            elif match.group("search_source") == "dz":
-                return cls(query, "Deezer", search=True)
-            elif match.group("search_source") == "ym":
-                return cls(query, "Yandex Music", search=True)
-            else:
-                return cls(query, SUPPORTED_SEARCHES[DEFAULT_SEARCH_SOURCE], search=True)
+            return cls(
+                query,
+                _SEARCH_SOURCES.get(match.group("search_source"), SUPPORTED_SEARCHES[DEFAULT_SEARCH_SOURCE]),
+                search=True,
+            )
         return None
 
     @classmethod
@@ -489,12 +663,10 @@ class Query:
         with contextlib.suppress(ValueError):
             url = is_url(query)
             query_final = query if url else await cls.__process_local_playlist(query)
-            if __ := SOURCE_INPUT_MATCH_M3U.match(query):
-                return cls(query_final, "M3U", query_type="album", special_local=not url)
-            elif __ := SOURCE_INPUT_MATCH_PLS.match(query):
-                return cls(query_final, "PLS", query_type="album", special_local=not url)
-            elif __ := SOURCE_INPUT_MATCH_PYLAV.match(query):
-                return cls(query_final, "PyLav", query_type="album", special_local=not url)
+            if match := SOURCE_INPUT_MATCH_PLAYLIST_FILE.match(query):
+                return cls(
+                    query_final, _PLAYLIST_FILE_SOURCES[match.lastgroup], query_type="album", special_local=not url
+                )
         return None
 
     @classmethod
@@ -526,7 +698,7 @@ class Query:
                 if source:
                     output._source = cls.__get_source_from_str(source)
                 return output
-            if (output := cls.__process_urls(query)) or (output := cls.__process_search(query)):
+            if output := cls.__process_string(query):
                 if source:
                     output._source = cls.__get_source_from_str(source)
                 return output
@@ -563,9 +735,7 @@ class Query:
             return query
         elif query is None:
             raise ValueError("Query cannot be None")
-        if output := cls.__process_urls(query):
-            return output
-        elif output := cls.__process_search(query):
+        if output := cls.__process_string(query):
             return output
         else:
             return cls(query, SUPPORTED_SEARCHES[DEFAULT_SEARCH_SOURCE], search=True)
@@ -607,12 +777,18 @@ class Query:
                 is_album=self.is_album,
             )
         assert isinstance(self._query, str)
-        if max_length and len(self._query) > max_length:
-            if add_ellipsis:
-                return f"{self._query[: max_length - 1].strip()}\N{HORIZONTAL ELLIPSIS}"
-            else:
-                return self._query[:max_length].strip()
-        return self._query
+        if not max_length or len(self._query) <= max_length:
+            return self._query
+        if self._string_cache is None:
+            self._string_cache = {}
+        elif (cached := self._string_cache.get((max_length, add_ellipsis))) is not None:
+            return cached
+        if add_ellipsis:
+            string = f"{self._query[: max_length - 1].strip()}\N{HORIZONTAL ELLIPSIS}"
+        else:
+            string = self._query[:max_length].strip()
+        self._string_cache[(max_length, add_ellipsis)] = string
+        return string
 
     async def _yield_pylav_file_tracks(self) -> AsyncIterator[Query]:
         if not self.is_pylav or not self.is_album:
@@ -772,7 +948,11 @@ class Query:
     async def folder(self) -> str | None:
         if self.is_local:
             if isinstance(self._query, LocalFile):
-                return self._query.parent.stem if await self._query.path.is_file() else self._query.name
+                if self._folder_cache is None:
+                    self._folder_cache = (
+                        self._query.parent.stem if await self._query.path.is_file() else self._query.name
+                    )
+                return self._folder_cache
             else:
                 return self._query
         return None
@@ -790,32 +970,9 @@ class Query:
             raise ValueError("Source can only be set for search queries")
 
         source = source.lower()
-        if source not in (allowed := {"ytm", "yt", "sp", "sc", "am", "local", "speak", "tts://", "dz", "lavasearch"}):
-            raise ValueError(f"Invalid source: {source} - Allowed: {allowed}")
-        match source:
-            case "ytm":
-                source = "YouTube Music"
-            case "yt":
-                source = "YouTube"
-            case "sp":
-                source = "Spotify"
-            case "sc":
-                source = "SoundCloud"
-            case "am":
-                source = "Apple Music"
-            case "local":
-                source = "Local"
-            case "speak":
-                source = "speak"
-            case "tts://":
-                source = "Google TTS"
-            case "dz":
-                source = "Deezer"
-            case "ym":
-                source = "Yandex Music"
-            case "lavasearch":
-                source = "LavaSearch"
-        self._source = source
+        if source not in _SOURCE_ALIASES:
+            raise ValueError(f"Invalid source: {source} - Allowed: {set(_SOURCE_ALIASES)}")
+        self._source = _SOURCE_ALIASES[source]
 
     def with_index(self, index: int) -> Query:
         return type(self)(
@@ -837,153 +994,15 @@ class Query:
 
     @classmethod
     def __get_source_from_str(cls, source: str) -> str:
-        match source:
-            case "spotify":
-                return "Spotify"
-            case "youtube":
-                return "YouTube Music"
-            case "soundcloud":
-                return "SoundCloud"
-            case "deezer":
-                return "Deezer"
-            case "applemusic":
-                return "Apple Music"
-            case "local":
-                return "Local"
-            case "speak":
-                return "speak"
-            case "gcloud-tts":
-                return "Google TTS"
-            case "http":
-                return "HTTP"
-            case "twitch":
-                return "Twitch"
-            case "vimeo":
-                return "Vimeo"
-            case "bandcamp":
-                return "Bandcamp"
-            case "mixcloud":
-                return "Mixcloud"
-            case "getyarn.io":
-                return "GetYarn"
-            case "ocremix":
-                return "OverClocked ReMix"
-            case "reddit":
-                return "Reddit"
-            case "clypit":
-                return "Clyp.it"
-            case "pornhub":
-                return "PornHub"
-            case "soundgasm":
-                return "SoundGasm"
-            case "tiktok":
-                return "TikTok"
-            case "niconico":
-                return "Niconico"
-            case "yandexmusic":
-                return "Yandex Music"
-            case __:
-                return SUPPORTED_SEARCHES[DEFAULT_SEARCH_SOURCE]
+        return _SOURCE_NAMES.get(source) or SUPPORTED_SEARCHES[DEFAULT_SEARCH_SOURCE]
 
     @property
     def requires_capability(self) -> str:
-        if self.is_spotify:
-            return "spotify"
-        elif self.is_apple_music:
-            return "applemusic"
-        elif self.is_youtube:
-            return "youtube"
-        elif self.is_soundcloud:
-            return "soundcloud"
-        elif self.is_local:
-            return "local"
-        elif self.is_twitch:
-            return "twitch"
-        elif self.is_bandcamp:
-            return "bandcamp"
-        elif self.is_http:
-            return "http"
-        elif self.is_speak:
-            return "speak"
-        elif self.is_gctts:
-            return "gcloud-tts"
-        elif self.is_flowery_tts:
-            return "flowery-tts"
-        elif self.is_getyarn:
-            return "getyarn.io"
-        elif self.is_clypit:
-            return "clypit"
-        elif self.is_pornhub:
-            return "pornhub"
-        elif self.is_reddit:
-            return "reddit"
-        elif self.is_ocremix:
-            return "ocremix"
-        elif self.is_tiktok:
-            return "tiktok"
-        elif self.is_mixcloud:
-            return "mixcloud"
-        elif self.is_soundgasm:
-            return "soundgasm"
-        elif self.is_vimeo:
-            return "vimeo"
-        elif self.is_deezer:
-            return "deezer"
-        elif self.is_yandex_music:
-            return "yandexmusic"
-        elif self.is_lavasearch:
-            return "lavasearch"
-        else:
-            return "youtube"
+        return "local" if self.is_local else _SOURCE_CAPABILITIES.get(self._source, "youtube")
 
     @property
     def source_abbreviation(self) -> str:
-        if self.is_spotify:
-            return "SP"
-        elif self.is_apple_music:
-            return "AM"
-        elif self.is_youtube:
-            return "YT"
-        elif self.is_soundcloud:
-            return "SC"
-        elif self.is_local:
-            return "LC"
-        elif self.is_twitch:
-            return "TW"
-        elif self.is_bandcamp:
-            return "BC"
-        elif self.is_http:
-            return "HTTP"
-        elif self.is_speak:
-            return "TTS"
-        elif self.is_gctts:
-            return "TTS"
-        elif self.is_flowery_tts:
-            return "TTS"
-        elif self.is_getyarn:
-            return "GY"
-        elif self.is_clypit:
-            return "CI"
-        elif self.is_pornhub:
-            return "PH"
-        elif self.is_reddit:
-            return "RD"
-        elif self.is_ocremix:
-            return "OCR"
-        elif self.is_tiktok:
-            return "TT"
-        elif self.is_mixcloud:
-            return "MX"
-        elif self.is_soundgasm:
-            return "SG"
-        elif self.is_vimeo:
-            return "VM"
-        elif self.is_deezer:
-            return "DZ"
-        elif self.is_yandex_music:
-            return "YDM"
-        else:
-            return "YT"
+        return "LC" if self.is_local else _SOURCE_ABBREVIATIONS.get(self._source, "YT")
 
 
 from pylav.players.query.utils import (  # noqa: E305
@@ -12,12 +12,12 @@ def process_youtube(cls: type[Query], query: str, music: bool) -> Query:
     _has_index = "&index=" in query
     if _has_index and (match := YOUTUBE_TRACK_INDEX.search(query)):
         index = int(match.group(1)) - 1
-    if all(k in query for k in ["&list=", "watch?"]):
+    if "&list=" in query and "watch?" in query:
         query_type = "playlist"
         index = 0
-    elif all(x in query for x in ["playlist?"]):
+    elif "playlist?" in query:
         query_type = "playlist"
-    elif any(k in query for k in ["list="]):
+    elif "list=" in query:
         index = 0
         query_type = "single" if _has_index else "playlist"
     else:
@@ -45,7 +45,7 @@ def process_deezer(cls: type[Query], query: str) -> Query:
     Query
         The processed query.
     """
-    search = SOURCE_INPUT_MATCH_DEEZER.search(query)
+    search = SOURCE_INPUT_MATCH_DEEZER.search(query.lower())
     if search is None:
         raise ValueError("Invalid Deezer query")
     data = search.groupdict()
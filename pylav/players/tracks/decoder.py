@@ -1,16 +1,54 @@
 from __future__ import annotations
 
 import asyncio
-import typing
-
-from dacite import from_dict  # type: ignore
+import contextlib
+import struct
+from collections.abc import Callable
 
 from pylav.logging import getLogger
-from pylav.nodes.api.responses.track import Track
+from pylav.nodes.api.responses.shared import TrackPluginInfo
+from pylav.nodes.api.responses.track import Info, Track
 from pylav.utils.vendor.lavalink_py.datarw import DataReader
 
 LOGGER = getLogger("PyLav.Track.Decoder")
 
+# (reader, version, artworkUrl, isrc) -> (artworkUrl, isrc, probeInfo)
+_SOURCE_READER_TYPE = Callable[[DataReader, int, str | None, str | None], tuple[str | None, str | None, str | None]]
+
+
+# noinspection PyPep8Naming
+def _read_probe_info(
+    reader: DataReader, version: int, artworkUrl: str | None, isrc: str | None
+) -> tuple[str | None, str | None, str | None]:
+    return artworkUrl, isrc, reader.read_utfm() if version >= 2 else None
+
+
+# noinspection PyPep8Naming
+def _read_isrc_and_artwork(
+    reader: DataReader, version: int, artworkUrl: str | None, isrc: str | None
+) -> tuple[str | None, str | None, str | None]:
+    if version != 2:
+        return artworkUrl, isrc, None
+    isrc = reader.read_nullable_utf()
+    return reader.read_nullable_utf(), isrc, None
+
+
+# noinspection PyPep8Naming
+def _read_artwork(
+    reader: DataReader, version: int, artworkUrl: str | None, isrc: str | None
+) -> tuple[str | None, str | None, str | None]:
+    return reader.read_nullable_utf() if version == 2 else artworkUrl, isrc, None
+
+
+_SOURCE_READERS: dict[str, _SOURCE_READER_TYPE] = {
+    "local": _read_probe_info,
+    "http": _read_probe_info,
+    "spotify": _read_isrc_and_artwork,
+    "applemusic": _read_isrc_and_artwork,
+    "deezer": _read_isrc_and_artwork,
+    "yandexmusic": _read_artwork,
+}
+
 
 # noinspection SpellCheckingInspection,PyPep8Naming
 def decode_track(track: str) -> Track:
@@ -43,45 +81,63 @@ def decode_track(track: str) -> Track:
         isrc = None
     source = reader.read_utf()
     try:
-        match source:
-            case "local" | "http" if version >= 2:
-                plugin_info["probeInfo"] = reader.read_utfm()
-            case "spotify" | "applemusic" | "deezer" if version == 2:
-                isrc = reader.read_nullable_utf()
-                artworkUrl = reader.read_nullable_utf()
-            case "yandexmusic" if version == 2:
-                artworkUrl = reader.read_nullable_utf()
+        if (source_reader := _SOURCE_READERS.get(source)) is not None:
+            artworkUrl, isrc, probe_info = source_reader(reader, version, artworkUrl, isrc)
+            if probe_info is not None:
+                plugin_info["probeInfo"] = probe_info
         # Position
         __ = reader.read_long()  # Discard position, we don't need it
-    except Exception as exc:
+    except (struct.error, IndexError, UnicodeError) as exc:
         LOGGER.verbose("Error while decoding version %d track: %s", version, track, exc_info=exc)
         raise UnicodeError("Error while decoding track") from exc
 
-    return typing.cast(
-        Track,
-        from_dict(
-            data_class=Track,
-            data={
-                "encoded": track,
-                "info": {
-                    "version": version,
-                    "title": title,
-                    "author": author,
-                    "length": length,
-                    "identifier": identifier,
-                    "isStream": is_stream,
-                    "uri": uri,
-                    "isSeekable": not is_stream,
-                    "sourceName": source,
-                    "artworkUrl": artworkUrl,
-                    "isrc": isrc,
-                    "position": 0,
-                },
-                "pluginInfo": plugin_info,
-            },
+    return Track(
+        encoded=track,
+        info=Info(
+            version=version,
+            title=title,
+            author=author,
+            length=length,
+            identifier=identifier,
+            isStream=is_stream,
+            uri=uri,
+            isSeekable=not is_stream,
+            sourceName=source,
+            artworkUrl=artworkUrl,
+            isrc=isrc,
+            position=0,
         ),
+        pluginInfo=TrackPluginInfo(kwargs=plugin_info),
     )
 
 
 async def async_decoder(track: str) -> Track:
     return await asyncio.to_thread(decode_track, track=track)
+
+
+def _decode_many(tracks: list[str], raise_on_failure: bool) -> list[Track]:
+    if raise_on_failure:
+        return [decode_track(track) for track in tracks]
+    decoded = []
+    for track in tracks:
+        with contextlib.suppress(Exception):
+            decoded.append(decode_track(track))
+    return decoded
+
+
+async def async_decode_many(tracks: list[str], raise_on_failure: bool = True) -> list[Track]:
+    """Decodes a list of base64 track strings in a single worker thread.
+
+    Parameters
+    ----------
+    tracks: :class:`list`[:class:`str`]
+        The base64 track strings.
+    raise_on_failure: :class:`bool`
+        Whether to raise if a track fails to decode, if `False` the track is skipped. Defaults to `True`.
+
+    Returns
+    -------
+    :class:`list`[:class:`Track`]
+    The decoded Track objects
+    """
+    return await asyncio.to_thread(_decode_many, tracks, raise_on_failure)
@@ -16,7 +16,7 @@ import discord
 import mutagen
 from dacite import from_dict
 
-from pylav.constants.regex import SQUARE_BRACKETS, STREAM_TITLE
+from pylav.constants.regex import STREAM_TITLE
 from pylav.exceptions.track import TrackNotFoundException
 from pylav.helpers import emojis
 from pylav.nodes.api.responses.playlists import Info
@@ -842,7 +842,7 @@ class Track:
     ) -> str:
         if not (unknown_title and unknown_author):
             track_name = f"{await self.title()}{author_string}"
-            track_name = SQUARE_BRACKETS.sub("", track_name).strip()
+            track_name = track_name.replace("[", "").replace("]", "").strip()
             if max_length and len(track_name) > (max_length - 1):
                 max_length -= 1
                 track_name = f"{track_name[:max_length]}\N{HORIZONTAL ELLIPSIS}"
@@ -850,7 +850,7 @@ class Track:
                 track_name += f"\n{await (await self.query()).query_to_string(add_ellipsis=False, no_extension=True)} "
         else:
             track_name = await (await self.query()).query_to_string(max_length, name_only=True, no_extension=True)
-            track_name = SQUARE_BRACKETS.sub("", track_name).strip()
+            track_name = track_name.replace("[", "").replace("]", "").strip()
         return track_name
 
     async def get_external_query_track_display_name(self, author_string: str, max_length: int | None = None) -> str:
@@ -864,7 +864,7 @@ class Track:
         else:
             track_name = title
 
-        track_name = SQUARE_BRACKETS.sub("", track_name).strip()
+        track_name = track_name.replace("[", "").replace("]", "").strip()
         if max_length is not None and len(track_name) > (max_length - 1):
             max_length -= 1
             return f"{track_name[:max_length]}\N{HORIZONTAL ELLIPSIS}"
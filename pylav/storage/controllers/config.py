@@ -9,6 +9,7 @@ from pylav.storage.database.tables.aiohttp_cache import AioHttpCacheRow
 from pylav.storage.database.tables.config import LibConfigRow
 from pylav.storage.database.tables.equalizer import EqualizerRow
 from pylav.storage.database.tables.m2m import TrackToPlaylists, TrackToQueries
+from pylav.storage.database.tables.misc import DATABASE_ENGINE
 from pylav.storage.database.tables.nodes import NodeRow, Sessions
 from pylav.storage.database.tables.player_state import PlayerStateRow
 from pylav.storage.database.tables.players import PlayerRow
@@ -43,33 +44,35 @@ class ConfigController:
     # noinspection PyProtectedMember
     @staticmethod
     async def create_tables() -> None:
-        await PlaylistRow.create_table(if_not_exists=True)
-        await LibConfigRow.create_table(if_not_exists=True)
-        await LibConfigRow.raw(
-            f"CREATE UNIQUE INDEX IF NOT EXISTS unique_lib_config_bot_id "
-            f"ON {LibConfigRow._meta.tablename} (bot, id)"
-        )
-        await EqualizerRow.create_table(if_not_exists=True)
-        await PlayerStateRow.create_table(if_not_exists=True)
-        await PlayerStateRow.raw(
-            f"CREATE UNIQUE INDEX IF NOT EXISTS unique_player_state_bot_id "
-            f"ON {PlayerStateRow._meta.tablename} (bot, id)"
-        )
-        await PlayerRow.create_table(if_not_exists=True)
-        await PlayerRow.raw(
-            f"CREATE UNIQUE INDEX IF NOT EXISTS unique_player_bot_id ON {PlayerRow._meta.tablename} (bot, id)"
-        )
-        await NodeRow.create_table(if_not_exists=True)
-        await QueryRow.create_table(if_not_exists=True)
-        await BotVersionRow.create_table(if_not_exists=True)
-        await AioHttpCacheRow.create_table(if_not_exists=True)
-        await TrackRow.create_table(if_not_exists=True)
-        await TrackToPlaylists.create_table(if_not_exists=True)
-        await TrackToQueries.create_table(if_not_exists=True)
-        await Sessions.create_table(if_not_exists=True)
-        await Sessions.raw(
-            f"CREATE UNIQUE INDEX IF NOT EXISTS unique_node_bot_id ON {Sessions._meta.tablename} (bot, node)"
-        )
+        # Run all the DDL in a single transaction rather than committing every statement on its own
+        async with DATABASE_ENGINE.transaction():
+            await PlaylistRow.create_table(if_not_exists=True)
+            await LibConfigRow.create_table(if_not_exists=True)
+            await LibConfigRow.raw(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS unique_lib_config_bot_id "
+                f"ON {LibConfigRow._meta.tablename} (bot, id)"
+            )
+            await EqualizerRow.create_table(if_not_exists=True)
+            await PlayerStateRow.create_table(if_not_exists=True)
+            await PlayerStateRow.raw(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS unique_player_state_bot_id "
+                f"ON {PlayerStateRow._meta.tablename} (bot, id)"
+            )
+            await PlayerRow.create_table(if_not_exists=True)
+            await PlayerRow.raw(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS unique_player_bot_id ON {PlayerRow._meta.tablename} (bot, id)"
+            )
+            await NodeRow.create_table(if_not_exists=True)
+            await QueryRow.create_table(if_not_exists=True)
+            await BotVersionRow.create_table(if_not_exists=True)
+            await AioHttpCacheRow.create_table(if_not_exists=True)
+            await TrackRow.create_table(if_not_exists=True)
+            await TrackToPlaylists.create_table(if_not_exists=True)
+            await TrackToQueries.create_table(if_not_exists=True)
+            await Sessions.create_table(if_not_exists=True)
+            await Sessions.raw(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS unique_node_bot_id ON {Sessions._meta.tablename} (bot, node)"
+            )
 
     # noinspection PyProtectedMember
     async def reset_database(self) -> None:
@@ -86,8 +89,8 @@ class ConfigController:
             f"{QueryRow._meta.tablename}, "
             f"{BotVersionRow._meta.tablename}, "
             f"{AioHttpCacheRow._meta.tablename}, "
-            f"{TrackRow._meta.tablename}"
-            ";"
+            f"{TrackRow._meta.tablename} "
+            "CASCADE;"
         )
         await self.create_tables()
 
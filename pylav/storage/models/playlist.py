@@ -19,7 +19,6 @@ from dacite import from_dict
 from pylav.compat import json
 from pylav.constants.config import BROTLI_ENABLED, READ_CACHING_ENABLED
 from pylav.constants.playlists import BUNDLED_PLAYLIST_IDS
-from pylav.constants.regex import SQUARE_BRACKETS
 from pylav.core.context import PyLavContext
 from pylav.exceptions.playlist import InvalidPlaylistException
 from pylav.helpers.singleton import SingletonCachedByKey
@@ -467,7 +466,7 @@ class Playlist(CachedModel, metaclass=SingletonCachedByKey):
             The formatted name.
         """
         unescaped_name = await self.fetch_name() or "Unnamed"
-        name = SQUARE_BRACKETS.sub("", unescaped_name).strip()
+        name = unescaped_name.replace("[", "").replace("]", "").strip()
         if with_url:
             url = await self.fetch_url()
             if url and url.startswith("http"):